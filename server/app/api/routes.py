@@ -1,8 +1,10 @@
+import orjson
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import List, Dict
-from app.services.rag import query_bible
-from app.services.multi_source_rag import query_multi_source
+from typing import AsyncIterator, List, Dict, Tuple
+from app.services.rag import query_bible, stream_bible
+from app.services.multi_source_rag import query_multi_source, stream_multi_source
 from app.services.multi_collection_store import multi_store
 
 router = APIRouter()
@@ -24,6 +26,8 @@ class Source(BaseModel):
     metadata: dict
 
 
+# Response models document the endpoints; the routes return ORJSONResponse so
+# the trusted service output is serialized without a validation pass
 class QueryResponse(BaseModel):
     answer: str
     sources: list[Source]
@@ -41,7 +45,7 @@ async def query(request: QueryRequest):
     """Query the Bible with a question (single source)."""
     try:
         result = await query_bible(request.question, request.num_passages)
-        return result
+        return ORJSONResponse(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -67,11 +71,55 @@ async def query_multi(request: MultiSourceRequest):
             collections=request.collections,
             k_per_collection=request.k_per_collection,
         )
-        return result
+        return ORJSONResponse(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _sse(events: AsyncIterator[Tuple[str, Dict]]) -> AsyncIterator[bytes]:
+    """Format service events as server-sent events."""
+    try:
+        async for event, data in events:
+            yield b"event: %s\ndata: %s\n\n" % (event.encode(), orjson.dumps(data))
+    except Exception as e:
+        # Headers are already sent, so report failures in-band
+        yield b"event: error\ndata: %s\n\n" % orjson.dumps({"detail": str(e)})
+
+
+@router.post("/query/stream")
+async def query_stream(request: QueryRequest):
+    """
+    Query the Bible and stream the answer as server-sent events.
+
+    Emits a `sources` event once retrieval finishes, then a `token` event
+    per generated text delta, then `done`.
+    """
+    return StreamingResponse(
+        _sse(stream_bible(request.question, request.num_passages)),
+        media_type="text/event-stream",
+    )
+
+
+@router.post("/query/multi-source/stream")
+async def query_multi_stream(request: MultiSourceRequest):
+    """
+    Query multiple document collections and stream the answer as server-sent events.
+
+    Emits a `sources` event once retrieval finishes, then a `token` event
+    per generated text delta, then `done`.
+    """
+    return StreamingResponse(
+        _sse(
+            stream_multi_source(
+                question=request.question,
+                collections=request.collections,
+                k_per_collection=request.k_per_collection,
+            )
+        ),
+        media_type="text/event-stream",
+    )
+
+
 @router.get("/collections")
 async def list_collections():
     """List all available document collections."""
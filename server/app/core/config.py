@@ -1,4 +1,5 @@
 import os
+from typing import Optional
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -11,6 +12,59 @@ class Settings:
     EMBEDDING_MODEL: str = os.getenv(
         "EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2"
     )
+    # "onnx" runs the INT8-quantized export on ONNX Runtime, "torch" the FP32 model
+    EMBEDDING_BACKEND: str = os.getenv("EMBEDDING_BACKEND", "onnx")
+    EMBEDDING_ONNX_FILE: str = os.getenv(
+        "EMBEDDING_ONNX_FILE", "onnx/model_qint8_avx512_vnni.onnx"
+    )
+    # "auto" uses CUDA when available and falls back to the CPU path above;
+    # on CUDA, torch runs FP16 weights and ONNX runs the GPU-optimized export,
+    # which needs onnxruntime-gpu (ONNX otherwise stays on the CPU INT8 path)
+    EMBEDDING_DEVICE: str = os.getenv("EMBEDDING_DEVICE", "auto")
+    EMBEDDING_ONNX_CUDA_FILE: str = os.getenv(
+        "EMBEDDING_ONNX_CUDA_FILE", "onnx/model_O4.onnx"
+    )
+    EMBEDDING_GPU_MEM_LIMIT_MB: int = int(os.getenv("EMBEDDING_GPU_MEM_LIMIT_MB", "1024"))
+    # Query embedding LRU cache; a TTL of 0 keeps entries until evicted
+    EMBEDDING_CACHE_SIZE: int = int(os.getenv("EMBEDDING_CACHE_SIZE", "4096"))
+    EMBEDDING_CACHE_TTL: float = float(os.getenv("EMBEDDING_CACHE_TTL", "3600"))
+    # Concurrent async query embeddings arriving within this window share a batch
+    EMBEDDING_BATCH_WAIT_MS: float = float(os.getenv("EMBEDDING_BATCH_WAIT_MS", "5"))
+    EMBEDDING_MAX_BATCH_SIZE: int = int(os.getenv("EMBEDDING_MAX_BATCH_SIZE", "32"))
+    # "chroma" searches through Chroma's query API, "hnsw" through an in-memory
+    # hnswlib graph persisted under HNSW_INDEX_DIR, "binary" through an
+    # in-memory binary-quantized index rescored with the FP32 vectors
+    # The in-memory indexes are built at startup and only refresh on in-process
+    # add_documents, so restart the server after running the ingestion scripts
+    SEARCH_BACKEND: str = os.getenv("SEARCH_BACKEND", "chroma")
+    BINARY_RESCORE_MULTIPLIER: int = int(os.getenv("BINARY_RESCORE_MULTIPLIER", "4"))
+    HNSW_INDEX_DIR: str = os.getenv(
+        "HNSW_INDEX_DIR", os.path.join(CHROMA_PERSIST_DIR, "hnsw")
+    )
+    # Multi-source results are pooled and ranked by cosine similarity; documents
+    # below the floor are dropped (unset keeps every hit, including negative
+    # scores) and at most RERANK_MAX_SOURCES kept (0 = all)
+    RERANK_MIN_SIMILARITY: Optional[float] = (
+        float(os.environ["RERANK_MIN_SIMILARITY"])
+        if os.getenv("RERANK_MIN_SIMILARITY")
+        else None
+    )
+    RERANK_MAX_SOURCES: int = int(os.getenv("RERANK_MAX_SOURCES", "0"))
+    # Answers are reused for questions at least this similar to one already
+    # answered; a size of 0 disables the cache, exact-only skips the similarity
+    # match, and answers expire after the TTL so new ingestion shows up
+    RESPONSE_CACHE_SIZE: int = int(os.getenv("RESPONSE_CACHE_SIZE", "0"))
+    RESPONSE_CACHE_TTL: float = float(os.getenv("RESPONSE_CACHE_TTL", "3600"))
+    RESPONSE_CACHE_MIN_SIMILARITY: float = float(
+        os.getenv("RESPONSE_CACHE_MIN_SIMILARITY", "0.97")
+    )
+    RESPONSE_CACHE_EXACT_ONLY: bool = (
+        os.getenv("RESPONSE_CACHE_EXACT_ONLY", "false").lower() == "true"
+    )
+    # Seconds a collection's document count is served from memory
+    COLLECTION_COUNT_TTL: float = float(os.getenv("COLLECTION_COUNT_TTL", "60"))
+    # PDF parser used by the ingestion scripts: "pymupdf", "pypdfium2" or "pypdf"
+    PDF_LOADER: str = os.getenv("PDF_LOADER", "pymupdf")
     COLLECTION_NAME: str = "bible"
 
 
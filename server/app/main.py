@@ -1,11 +1,20 @@
+import queue
+import asyncio
+import logging
+import logging.handlers
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.routes import router
+from app.services.llm import get_http_client, close_http_client
+from app.services.multi_collection_store import multi_store
+from app.services.embeddings import start_embedding_batcher, stop_embedding_batcher
 
 app = FastAPI(
     title="Hermeneutic API",
     description="Bible RAG API using LangChain and ChromaDB",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware for Next.js frontend
@@ -19,7 +28,45 @@ app.add_middleware(
 
 app.include_router(router, prefix="/api")
 
+# Drains queued log records to stderr on a background thread
+log_listener = logging.handlers.QueueListener(
+    queue.SimpleQueue(), logging.StreamHandler(), respect_handler_level=True
+)
+
+
+@app.on_event("startup")
+async def startup():
+    # Route app logs through a queue so handlers never block the event loop
+    app_logger = logging.getLogger("app")
+    app_logger.addHandler(logging.handlers.QueueHandler(log_listener.queue))
+    app_logger.setLevel(logging.INFO)
+    log_listener.start()
+
+    # Open the pooled OpenRouter client once for the process lifetime
+    get_http_client()
+
+    # Coalesce concurrent query embeddings into batched model calls
+    await start_embedding_batcher()
+
+    # Load in-memory search indexes before the first query needs them
+    await asyncio.to_thread(multi_store.warm_indexes)
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    await close_http_client()
+    await stop_embedding_batcher()
+    log_listener.stop()
+
 
 @app.get("/")
 async def root():
     return {"message": "Hermeneutic Bible RAG API"}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvicorn creates the event loop before importing the app, so the loop
+    # implementation has to be chosen here rather than with uvloop.install()
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
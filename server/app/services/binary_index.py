@@ -0,0 +1,138 @@
+"""
+Binary-Quantized Vector Index.
+
+Keeps a 1-bit-per-dimension copy of a collection's embeddings in memory
+(384 dims -> 48 bytes per document instead of 1536) and selects candidates
+by hamming distance, then rescores the shortlist with a float16 copy of the
+vectors so the final ranking matches a normal cosine search.
+"""
+
+import numpy as np
+from langchain.schema import Document
+from typing import List, Optional, Tuple
+from app.services.bin_rerank import pack_u64, hamming_topk
+
+
+def quantize_binary(embeddings: np.ndarray) -> np.ndarray:
+    """
+    Pack embeddings into one bit per dimension.
+
+    Args:
+        embeddings: Array of shape (dim,) or (n, dim)
+
+    Returns:
+        uint8 array of shape (dim / 8,) or (n, dim / 8)
+    """
+    return np.packbits(np.asarray(embeddings) > 0, axis=-1)
+
+
+class BinaryIndex:
+    """In-memory binary-quantized index over one collection."""
+
+    def __init__(
+        self,
+        embeddings: np.ndarray,
+        documents: List[str],
+        metadatas: List[Optional[dict]],
+    ):
+        """
+        Build the index.
+
+        Args:
+            embeddings: Normalized float embeddings of shape (n, dim)
+            documents: Page content for each row
+            metadatas: Metadata for each row
+        """
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if not len(documents):
+            embeddings = embeddings.reshape(0, 0)
+
+        self.packed = pack_u64(quantize_binary(embeddings))
+        # Normalized MiniLM vectors fit comfortably in float16, which halves
+        # the memory and bandwidth of the rescoring copy
+        self.embeddings = embeddings.astype(np.float16)
+        self.documents = documents
+        self.metadatas = metadatas
+
+    @classmethod
+    def from_collection(cls, collection) -> "BinaryIndex":
+        """
+        Build an index from the vectors a Chroma collection has persisted.
+
+        Args:
+            collection: Raw chromadb collection
+
+        Returns:
+            BinaryIndex over every document in the collection
+        """
+        data = collection.get(include=["embeddings", "documents", "metadatas"])
+        return cls(data["embeddings"], data["documents"], data["metadatas"])
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def search(
+        self,
+        query_embedding: List[float],
+        k: int = 5,
+        rescore_multiplier: int = 4,
+    ) -> List[Document]:
+        """
+        Search the index.
+
+        Args:
+            query_embedding: Embedded search query
+            k: Number of results
+            rescore_multiplier: Hamming shortlist size as a multiple of k
+
+        Returns:
+            List of matching documents, best first
+        """
+        return [
+            doc
+            for doc, _ in self.search_with_scores(query_embedding, k, rescore_multiplier)
+        ]
+
+    def search_with_scores(
+        self,
+        query_embedding: List[float],
+        k: int = 5,
+        rescore_multiplier: int = 4,
+        extra_metadata: Optional[dict] = None,
+    ) -> List[Tuple[Document, float]]:
+        """
+        Search the index and return cosine similarities.
+
+        Args:
+            query_embedding: Embedded search query
+            k: Number of results
+            rescore_multiplier: Hamming shortlist size as a multiple of k
+            extra_metadata: Metadata merged into every returned document
+
+        Returns:
+            List of (document, similarity) pairs, best first
+        """
+        if not len(self):
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        # Shortlist by hamming distance, then rescore in full precision
+        candidates = hamming_topk(
+            self.packed,
+            pack_u64(quantize_binary(query)),
+            k * rescore_multiplier,
+        )
+
+        scores = self.embeddings[candidates].astype(np.float32) @ query
+        order = np.argsort(-scores)[:k]
+
+        return [
+            (
+                Document(
+                    page_content=self.documents[i],
+                    metadata={**(self.metadatas[i] or {}), **(extra_metadata or {})},
+                ),
+                float(score),
+            )
+            for i, score in zip(candidates[order], scores[order])
+        ]
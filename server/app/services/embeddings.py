@@ -1,11 +1,280 @@
-from langchain_huggingface import HuggingFaceEmbeddings
+import os
+import time
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from langchain_core.embeddings import Embeddings
+from sentence_transformers import SentenceTransformer
 from app.core.config import settings
 
 
-def get_embeddings() -> HuggingFaceEmbeddings:
-    """Get HuggingFace embeddings model."""
-    return HuggingFaceEmbeddings(
-        model_name=settings.EMBEDDING_MODEL,
-        model_kwargs={"device": "cpu"},
-        encode_kwargs={"normalize_embeddings": True},
+class SentenceTransformerEmbeddings(Embeddings):
+    """LangChain embeddings backed by a SentenceTransformer model."""
+
+    def __init__(self, model: SentenceTransformer):
+        self.model = model
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch of documents."""
+        return self.model.encode(texts, normalize_embeddings=True).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a single query."""
+        return self.model.encode(text, normalize_embeddings=True).tolist()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    LRU cache in front of another embeddings model.
+
+    Queries are keyed by the SHA-256 digest of their text, so a repeated
+    question skips the model forward pass entirely. Documents pass through
+    uncached since they are embedded once at ingestion time.
+    """
+
+    def __init__(self, embeddings: Embeddings, maxsize: int = 4096, ttl: float = 0):
+        self.embeddings = embeddings
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._cache: "OrderedDict[bytes, Tuple[float, List[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch of documents."""
+        return self.embeddings.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a single query, serving repeats from the cache."""
+        key = hashlib.sha256(text.encode()).digest()
+
+        vector = self._lookup(key)
+        if vector is None:
+            vector = self.embeddings.embed_query(text)
+            self._store(key, vector)
+
+        return vector
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """Embed a single query asynchronously, serving repeats from the cache."""
+        key = hashlib.sha256(text.encode()).digest()
+
+        vector = self._lookup(key)
+        if vector is None:
+            vector = await self.embeddings.aembed_query(text)
+            self._store(key, vector)
+
+        return vector
+
+    def _lookup(self, key: bytes) -> Optional[List[float]]:
+        """Get a cached vector if present and not expired."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and (not self.ttl or entry[0] > time.monotonic()):
+                self._cache.move_to_end(key)
+                return entry[1]
+        return None
+
+    def _store(self, key: bytes, vector: List[float]) -> None:
+        """Cache a vector, evicting the least recently used entries."""
+        with self._lock:
+            self._cache[key] = (time.monotonic() + self.ttl, vector)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+
+class BatchedEmbeddings(Embeddings):
+    """
+    Micro-batcher for concurrent async query embeddings.
+
+    aembed_query calls that arrive within max_wait seconds of each other are
+    coalesced into one embed_documents call, so concurrent requests share a
+    single batched forward pass. Sync calls go straight to the model.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        max_wait: float = 0.005,
+        max_batch_size: int = 32,
+    ):
+        self.embeddings = embeddings
+        self.max_wait = max_wait
+        self.max_batch_size = max_batch_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch of documents."""
+        return self.embeddings.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a single query."""
+        return self.embeddings.embed_query(text)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """Embed a single query as part of the next batch."""
+        if not self._is_running():
+            await self.start()
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def start(self) -> None:
+        """Start the batching task on the running event loop."""
+        if not self._is_running():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the batching task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _is_running(self) -> bool:
+        """Whether the batching task is alive on the current event loop."""
+        return (
+            self._task is not None
+            and not self._task.done()
+            and self._task.get_loop() is asyncio.get_running_loop()
+        )
+
+    async def _run(self) -> None:
+        """Collect queued queries into batches and embed them."""
+        while True:
+            batch = [await self._queue.get()]
+
+            # Give concurrent requests a moment to join the batch
+            await asyncio.sleep(self.max_wait)
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                vectors = await asyncio.to_thread(
+                    self.embeddings.embed_documents, [text for text, _ in batch]
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector)
+
+
+def _embedding_device() -> str:
+    """Resolve the configured embedding device, preferring CUDA under "auto"."""
+    if settings.EMBEDDING_DEVICE != "auto":
+        return settings.EMBEDDING_DEVICE
+
+    import torch
+
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+def _onnx_cuda_available() -> bool:
+    """Whether the installed ONNX Runtime build can run on CUDA."""
+    import onnxruntime as ort
+
+    return "CUDAExecutionProvider" in ort.get_available_providers()
+
+
+def _load_model() -> SentenceTransformer:
+    """Load the embedding model for the configured backend and device."""
+    device = _embedding_device()
+
+    if settings.EMBEDDING_BACKEND == "onnx":
+        # The CPU onnxruntime wheel has no CUDA provider even on GPU hosts
+        if device.startswith("cuda") and _onnx_cuda_available():
+            return SentenceTransformer(
+                settings.EMBEDDING_MODEL,
+                device=device,
+                backend="onnx",
+                model_kwargs={
+                    "file_name": settings.EMBEDDING_ONNX_CUDA_FILE,
+                    "provider": "CUDAExecutionProvider",
+                    "provider_options": {
+                        "gpu_mem_limit": settings.EMBEDDING_GPU_MEM_LIMIT_MB * 1024 * 1024,
+                    },
+                },
+            )
+
+        import onnxruntime as ort
+
+        # Leave half the cores to the event loop and Chroma
+        sess_options = ort.SessionOptions()
+        sess_options.intra_op_num_threads = max(1, (os.cpu_count() or 2) // 2)
+
+        return SentenceTransformer(
+            settings.EMBEDDING_MODEL,
+            device="cpu",
+            backend="onnx",
+            model_kwargs={
+                "file_name": settings.EMBEDDING_ONNX_FILE,
+                "provider": "CPUExecutionProvider",
+                "session_options": sess_options,
+            },
+        )
+
+    if device.startswith("cuda"):
+        import torch
+
+        model = SentenceTransformer(
+            settings.EMBEDDING_MODEL,
+            device=device,
+            model_kwargs={"torch_dtype": torch.float16},
+        )
+        # Compile the transformer once; batches from the micro-batcher vary
+        # in length, so compile with dynamic shapes to avoid recompiling
+        transformer = model[0]
+        transformer.auto_model = torch.compile(
+            transformer.auto_model, mode="reduce-overhead", dynamic=True
+        )
+        return model
+
+    return SentenceTransformer(settings.EMBEDDING_MODEL, device="cpu")
+
+
+@lru_cache()
+def _get_batcher() -> BatchedEmbeddings:
+    """Get the shared micro-batcher around the embedding model."""
+    return BatchedEmbeddings(
+        SentenceTransformerEmbeddings(_load_model()),
+        max_wait=settings.EMBEDDING_BATCH_WAIT_MS / 1000,
+        max_batch_size=settings.EMBEDDING_MAX_BATCH_SIZE,
+    )
+
+
+@lru_cache()
+def get_embeddings() -> Embeddings:
+    """
+    Get the sentence-transformers embeddings model behind a query cache.
+
+    The model is loaded once per process and shared by every vector store.
+    """
+    return CachedEmbeddings(
+        _get_batcher(),
+        maxsize=settings.EMBEDDING_CACHE_SIZE,
+        ttl=settings.EMBEDDING_CACHE_TTL,
     )
+
+
+async def start_embedding_batcher() -> None:
+    """Start micro-batching async query embeddings on the running loop."""
+    await _get_batcher().start()
+
+
+async def stop_embedding_batcher() -> None:
+    """Stop micro-batching async query embeddings."""
+    await _get_batcher().stop()
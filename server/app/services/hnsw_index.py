@@ -0,0 +1,194 @@
+"""
+HNSW Vector Index.
+
+Serves similarity search from an in-memory hnswlib graph with plain list
+side tables for page content and metadata, keeping Chroma only as the
+persistence layer. The graph is saved next to the Chroma data so restarts
+load it from disk instead of rebuilding.
+"""
+
+import os
+import orjson
+import hnswlib
+import numpy as np
+from langchain.schema import Document
+from typing import List, Optional, Tuple
+
+
+class HnswIndex:
+    """In-memory HNSW index over one collection."""
+
+    def __init__(
+        self,
+        index: hnswlib.Index,
+        documents: List[str],
+        metadatas: List[Optional[dict]],
+    ):
+        """
+        Wrap a built index.
+
+        Args:
+            index: hnswlib index whose labels are row positions
+            documents: Page content for each row
+            metadatas: Metadata for each row
+        """
+        self.index = index
+        self.documents = documents
+        self.metadatas = metadatas
+
+    @classmethod
+    def build(
+        cls,
+        embeddings: np.ndarray,
+        documents: List[str],
+        metadatas: List[Optional[dict]],
+        M: int = 32,
+        ef_construction: int = 200,
+        ef_search: int = 64,
+    ) -> "HnswIndex":
+        """
+        Build an index from normalized embeddings.
+
+        Args:
+            embeddings: Normalized float embeddings of shape (n, dim)
+            documents: Page content for each row
+            metadatas: Metadata for each row
+            M: Graph degree
+            ef_construction: Candidate list size while building
+            ef_search: Candidate list size while searching
+
+        Returns:
+            HnswIndex over the rows
+        """
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        dim = embeddings.shape[1] if len(documents) else 1
+
+        index = hnswlib.Index(space="ip", dim=dim)
+        index.init_index(
+            max_elements=max(1, len(documents)),
+            M=M,
+            ef_construction=ef_construction,
+        )
+        if len(documents):
+            index.add_items(embeddings, np.arange(len(documents)))
+        index.set_ef(ef_search)
+
+        return cls(index, documents, metadatas)
+
+    @classmethod
+    def from_collection(cls, collection, cache_dir: str) -> "HnswIndex":
+        """
+        Load a collection's index from disk, rebuilding it if it is stale.
+
+        Args:
+            collection: Raw chromadb collection
+            cache_dir: Directory holding saved indexes
+
+        Returns:
+            HnswIndex over every document in the collection
+        """
+        path = os.path.join(cache_dir, collection.name)
+
+        index = cls.load(path)
+        if index is not None and len(index) == collection.count():
+            return index
+
+        data = collection.get(include=["embeddings", "documents", "metadatas"])
+        index = cls.build(data["embeddings"], data["documents"], data["metadatas"])
+        index.save(path)
+
+        return index
+
+    def save(self, path: str) -> None:
+        """
+        Save the graph and side tables.
+
+        Args:
+            path: File prefix; writes <path>.bin and <path>.json
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.index.save_index(f"{path}.bin")
+
+        with open(f"{path}.json", "wb") as f:
+            f.write(orjson.dumps({
+                "dim": self.index.dim,
+                "documents": self.documents,
+                "metadatas": self.metadatas,
+            }))
+
+    @classmethod
+    def load(cls, path: str, ef_search: int = 64) -> Optional["HnswIndex"]:
+        """
+        Load a saved index.
+
+        Args:
+            path: File prefix passed to save()
+            ef_search: Candidate list size while searching
+
+        Returns:
+            HnswIndex, or None if nothing is saved at path
+        """
+        if not (os.path.exists(f"{path}.bin") and os.path.exists(f"{path}.json")):
+            return None
+
+        with open(f"{path}.json", "rb") as f:
+            tables = orjson.loads(f.read())
+
+        index = hnswlib.Index(space="ip", dim=tables["dim"])
+        index.load_index(f"{path}.bin")
+        index.set_ef(ef_search)
+
+        return cls(index, tables["documents"], tables["metadatas"])
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def search(self, query_embedding: List[float], k: int = 5) -> List[Document]:
+        """
+        Search the index.
+
+        Args:
+            query_embedding: Embedded search query
+            k: Number of results
+
+        Returns:
+            List of matching documents, best first
+        """
+        return [doc for doc, _ in self.search_with_scores(query_embedding, k)]
+
+    def search_with_scores(
+        self,
+        query_embedding: List[float],
+        k: int = 5,
+        extra_metadata: Optional[dict] = None,
+    ) -> List[Tuple[Document, float]]:
+        """
+        Search the index and return cosine similarities.
+
+        Args:
+            query_embedding: Embedded search query
+            k: Number of results
+            extra_metadata: Metadata merged into every returned document
+
+        Returns:
+            List of (document, similarity) pairs, best first
+        """
+        k = min(k, len(self))
+        if not k:
+            return []
+
+        labels, distances = self.index.knn_query(
+            np.asarray(query_embedding, dtype=np.float32), k=k
+        )
+
+        # Inner-product space reports 1 - dot(q, x)
+        return [
+            (
+                Document(
+                    page_content=self.documents[i],
+                    metadata={**(self.metadatas[i] or {}), **(extra_metadata or {})},
+                ),
+                1.0 - float(distance),
+            )
+            for i, distance in zip(labels[0], distances[0])
+        ]
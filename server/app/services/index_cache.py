@@ -0,0 +1,48 @@
+"""
+In-Memory Index Cache.
+
+Holds one in-memory vector index per Chroma collection for the search
+backends that bypass Chroma's own query path.
+"""
+
+import threading
+from typing import Any, Callable, Dict
+
+
+class IndexCache:
+    """Lazily built indexes, one per collection."""
+
+    def __init__(self, build: Callable[[Any], Any]):
+        """
+        Initialize the cache.
+
+        Args:
+            build: Builds an index from a raw chromadb collection
+        """
+        self._build = build
+        self._indexes: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, collection) -> Any:
+        """
+        Get the index for a collection, building it on first use.
+
+        Args:
+            collection: Raw chromadb collection
+
+        Returns:
+            Index for the collection
+        """
+        index = self._indexes.get(collection.name)
+        if index is None:
+            with self._lock:
+                index = self._indexes.get(collection.name)
+                if index is None:
+                    index = self._build(collection)
+                    self._indexes[collection.name] = index
+        return index
+
+    def invalidate(self, collection) -> None:
+        """Drop a collection's index so the next search rebuilds it."""
+        with self._lock:
+            self._indexes.pop(collection.name, None)
@@ -1,17 +1,54 @@
 import httpx
+import orjson
+from typing import AsyncIterator, Dict, List, Optional
 from app.core.config import settings
 
 OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
 
+# Shared client so every OpenRouter call reuses pooled keep-alive connections
+_client: Optional[httpx.AsyncClient] = None
 
-async def get_completion(prompt: str, context: str) -> str:
-    """Get completion from OpenRouter API using Claude."""
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared OpenRouter HTTP client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=60.0,
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=60,
+            ),
+            http2=True,
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+HEADERS = {
+    "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
+    "Content-Type": "application/json",
+    "HTTP-Referer": "http://localhost:3000",
+    "X-Title": "Hermeneutic Bible App",
+}
+
+
+def _build_messages(prompt: str, context: str) -> List[Dict[str, str]]:
+    """Build the chat messages for a single-source Scripture question."""
     system_prompt = """You are a knowledgeable Bible study assistant.
 Use the provided scripture passages to answer questions accurately and thoughtfully.
 Always cite the specific verses you reference in your response.
 If the context doesn't contain relevant information, say so honestly."""
 
-    messages = [
+    return [
         {"role": "system", "content": system_prompt},
         {
             "role": "user",
@@ -19,24 +56,84 @@ If the context doesn't contain relevant information, say so honestly."""
         },
     ]
 
-    headers = {
-        "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": "http://localhost:3000",
-        "X-Title": "Hermeneutic Bible App",
+
+async def chat_completion(messages: List[Dict[str, str]], max_tokens: int) -> str:
+    """
+    Get a full chat completion from OpenRouter.
+
+    Args:
+        messages: Chat messages
+        max_tokens: Maximum tokens to generate
+
+    Returns:
+        LLM response
+    """
+    payload = {
+        "model": settings.LLM_MODEL,
+        "messages": messages,
+        "max_tokens": max_tokens,
+        "temperature": 0.7,
     }
 
+    # orjson encodes straight to UTF-8 bytes, skipping json's intermediate str
+    response = await get_http_client().post(
+        OPENROUTER_URL, content=orjson.dumps(payload), headers=HEADERS
+    )
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    return data["choices"][0]["message"]["content"]
+
+
+async def stream_chat_completion(
+    messages: List[Dict[str, str]],
+    max_tokens: int,
+) -> AsyncIterator[str]:
+    """
+    Stream a chat completion from OpenRouter as it is generated.
+
+    Args:
+        messages: Chat messages
+        max_tokens: Maximum tokens to generate
+
+    Yields:
+        Text deltas in generation order
+    """
     payload = {
         "model": settings.LLM_MODEL,
         "messages": messages,
-        "max_tokens": 1024,
+        "max_tokens": max_tokens,
         "temperature": 0.7,
+        "stream": True,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            OPENROUTER_URL, json=payload, headers=headers, timeout=60.0
-        )
+    async with get_http_client().stream(
+        "POST", OPENROUTER_URL, content=orjson.dumps(payload), headers=HEADERS
+    ) as response:
         response.raise_for_status()
-        data = response.json()
-        return data["choices"][0]["message"]["content"]
+
+        async for line in response.aiter_lines():
+            # Skip keep-alive comments and blank separators
+            if not line.startswith("data: "):
+                continue
+
+            data = line[len("data: "):]
+            if data == "[DONE]":
+                break
+
+            chunk = orjson.loads(data)
+            content = chunk["choices"][0]["delta"].get("content")
+            if content:
+                yield content
+
+
+async def get_completion(prompt: str, context: str) -> str:
+    """Get completion from OpenRouter API using Claude."""
+    return await chat_completion(_build_messages(prompt, context), max_tokens=1024)
+
+
+async def stream_completion(prompt: str, context: str) -> AsyncIterator[str]:
+    """Stream completion from OpenRouter API using Claude."""
+    async for content in stream_chat_completion(
+        _build_messages(prompt, context), max_tokens=1024
+    ):
+        yield content
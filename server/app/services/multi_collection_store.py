@@ -6,13 +6,23 @@ This service manages multiple ChromaDB collections for different document types
 unified querying across all collections.
 """
 
+import time
+import uuid
+import asyncio
+import logging
 import chromadb
+import numpy as np
 from chromadb.config import Settings as ChromaSettings
 from langchain_community.vectorstores import Chroma
 from langchain.schema import Document
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from app.core.config import settings
 from app.services.embeddings import get_embeddings
+from app.services.binary_index import BinaryIndex
+from app.services.hnsw_index import HnswIndex
+from app.services.index_cache import IndexCache
+
+logger = logging.getLogger(__name__)
 
 
 class MultiCollectionStore:
@@ -34,6 +44,37 @@ class MultiCollectionStore:
             path=settings.CHROMA_PERSIST_DIR,
             settings=ChromaSettings(anonymized_telemetry=False),
         )
+        self.indexes = IndexCache(self._build_index)
+        # Collection name -> (count, expiry), see get_collection_count
+        self._counts: Dict[str, Tuple[int, float]] = {}
+
+        # Build each Chroma wrapper once instead of per request
+        self._collections: Dict[str, Chroma] = {
+            name: self._create_collection(collection_id)
+            for name, collection_id in self.COLLECTIONS.items()
+        }
+
+    def _create_collection(self, collection_id: str) -> Chroma:
+        """Create a Chroma wrapper for a collection."""
+        return Chroma(
+            client=self.client,
+            collection_name=collection_id,
+            embedding_function=self.embeddings,
+        )
+
+    def _build_index(self, collection):
+        """Build the in-memory index for the configured search backend."""
+        if settings.SEARCH_BACKEND == "hnsw":
+            return HnswIndex.from_collection(collection, settings.HNSW_INDEX_DIR)
+        return BinaryIndex.from_collection(collection)
+
+    def warm_indexes(self) -> None:
+        """Load in-memory indexes for every collection ahead of the first query."""
+        if settings.SEARCH_BACKEND == "chroma":
+            return
+
+        for collection_name in self.COLLECTIONS:
+            self.indexes.get(self.get_collection(collection_name)._collection)
 
     def get_collection(self, collection_name: str) -> Chroma:
         """
@@ -45,19 +86,20 @@ class MultiCollectionStore:
         Returns:
             Chroma vector store instance
         """
-        collection_id = self.COLLECTIONS.get(collection_name, collection_name)
+        collection = self._collections.get(collection_name)
 
-        return Chroma(
-            client=self.client,
-            collection_name=collection_id,
-            embedding_function=self.embeddings,
-        )
+        if collection is None:
+            collection = self._create_collection(collection_name)
+            self._collections[collection_name] = collection
+
+        return collection
 
     def search_collection(
         self,
         collection_name: str,
         query: str,
         k: int = 5,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Document]:
         """
         Search within a specific collection.
@@ -66,36 +108,125 @@ class MultiCollectionStore:
             collection_name: Name of the collection
             query: Search query
             k: Number of results
+            query_embedding: Precomputed embedding of query, to skip re-embedding
 
         Returns:
             List of matching documents
         """
+        if query_embedding is None:
+            query_embedding = self.embeddings.embed_query(query)
+
+        return [
+            doc
+            for doc, _ in self.search_collection_with_scores(
+                collection_name, query_embedding, k=k
+            )
+        ]
+
+    def search_collection_with_scores(
+        self,
+        collection_name: str,
+        query_embedding: List[float],
+        k: int = 5,
+    ) -> List[Tuple[Document, float]]:
+        """
+        Search within a specific collection and return cosine similarities.
+
+        Args:
+            collection_name: Name of the collection
+            query_embedding: Embedded search query
+            k: Number of results
+
+        Returns:
+            List of (document, similarity) pairs, best first
+        """
+        # Tag results with their collection while building them
+        extra_metadata = {"collection": collection_name}
+
         try:
             collection = self.get_collection(collection_name)
-            results = collection.similarity_search(query, k=k)
 
-            # Add collection info to metadata
-            for doc in results:
-                doc.metadata["collection"] = collection_name
+            if settings.SEARCH_BACKEND == "binary":
+                index = self.indexes.get(collection._collection)
+                return index.search_with_scores(
+                    query_embedding,
+                    k=k,
+                    rescore_multiplier=settings.BINARY_RESCORE_MULTIPLIER,
+                    extra_metadata=extra_metadata,
+                )
+            elif settings.SEARCH_BACKEND == "hnsw":
+                index = self.indexes.get(collection._collection)
+                return index.search_with_scores(
+                    query_embedding, k=k, extra_metadata=extra_metadata
+                )
+            else:
+                return self._query_chroma(
+                    collection, query_embedding, k, extra_metadata
+                )
+        except Exception:
+            logger.exception("Error searching collection %s", collection_name)
+            return []
+
+    def _query_chroma(
+        self,
+        collection: Chroma,
+        query_embedding: List[float],
+        k: int,
+        extra_metadata: Optional[dict] = None,
+    ) -> List[Tuple[Document, float]]:
+        """
+        Query Chroma's raw collection and score hits by cosine similarity.
 
-            return results
-        except Exception as e:
-            print(f"Error searching collection {collection_name}: {e}")
+        Skips the LangChain wrapper, which would re-embed the query and
+        build its Documents through several extra layers.
+        """
+        results = collection._collection.query(
+            query_embeddings=[query_embedding],
+            n_results=k,
+            include=["documents", "metadatas", "embeddings"],
+        )
+
+        documents = results["documents"][0]
+        if not documents:
             return []
 
-    def search_multi_collection(
+        # Stored vectors are normalized, so one GEMV gives cosine similarity
+        scores = np.asarray(results["embeddings"][0], dtype=np.float32) @ np.asarray(
+            query_embedding, dtype=np.float32
+        )
+
+        return [
+            (
+                Document(
+                    page_content=content,
+                    metadata={**(metadata or {}), **(extra_metadata or {})},
+                ),
+                float(score),
+            )
+            for content, metadata, score in zip(
+                documents, results["metadatas"][0], scores
+            )
+        ]
+
+    async def search_multi_collection(
         self,
         query: str,
         collections: List[str] = None,
         k_per_collection: int = 3,
-    ) -> Dict[str, List[Document]]:
+        with_scores: bool = False,
+    ) -> Dict[str, List]:
         """
-        Search across multiple collections.
+        Search across multiple collections concurrently.
+
+        The query is embedded once and the per-collection searches run in
+        worker threads, so latency is the slowest collection rather than
+        the sum of all of them.
 
         Args:
             query: Search query
             collections: List of collection names (default: all)
             k_per_collection: Results per collection
+            with_scores: Return (document, similarity) pairs instead of documents
 
         Returns:
             Dictionary mapping collection names to documents
@@ -103,16 +234,29 @@ class MultiCollectionStore:
         if collections is None:
             collections = list(self.COLLECTIONS.keys())
 
+        query_embedding = await self.embeddings.aembed_query(query)
+
+        all_docs = await asyncio.gather(*[
+            asyncio.to_thread(
+                self.search_collection_with_scores,
+                collection_name,
+                query_embedding,
+                k_per_collection,
+            )
+            for collection_name in collections
+        ])
+
         results = {}
 
-        for collection_name in collections:
-            docs = self.search_collection(collection_name, query, k=k_per_collection)
+        for collection_name, docs in zip(collections, all_docs):
             if docs:
-                results[collection_name] = docs
+                results[collection_name] = (
+                    docs if with_scores else [doc for doc, _ in docs]
+                )
 
         return results
 
-    def search_all_collections(
+    async def search_all_collections(
         self,
         query: str,
         k_per_collection: int = 3,
@@ -127,7 +271,7 @@ class MultiCollectionStore:
         Returns:
             Combined list of documents from all collections
         """
-        all_results = self.search_multi_collection(
+        all_results = await self.search_multi_collection(
             query=query,
             collections=None,
             k_per_collection=k_per_collection,
@@ -144,6 +288,8 @@ class MultiCollectionStore:
         self,
         collection_name: str,
         documents: List[Document],
+        embeddings: Optional[List[List[float]]] = None,
+        ids: Optional[List[str]] = None,
     ) -> None:
         """
         Add documents to a specific collection.
@@ -151,9 +297,26 @@ class MultiCollectionStore:
         Args:
             collection_name: Name of the collection
             documents: List of documents to add
+            embeddings: Precomputed embeddings of the documents, to skip embedding
+            ids: Document ids; random ids are generated if omitted
         """
         collection = self.get_collection(collection_name)
-        collection.add_documents(documents)
+
+        texts = [doc.page_content for doc in documents]
+        metadatas = [doc.metadata or None for doc in documents]
+        if embeddings is None:
+            embeddings = self.embeddings.embed_documents(texts)
+        if ids is None:
+            ids = [str(uuid.uuid4()) for _ in documents]
+
+        collection._collection.add(
+            ids=ids,
+            embeddings=embeddings,
+            documents=texts,
+            metadatas=metadatas,
+        )
+        self.indexes.invalidate(collection._collection)
+        self._counts.pop(collection_name, None)
 
     def list_collections(self) -> List[str]:
         """
@@ -172,14 +335,26 @@ class MultiCollectionStore:
             collection_name: Name of the collection
 
         Returns:
-            Number of documents in collection
+            Number of documents in collection, cached for COLLECTION_COUNT_TTL
+            seconds since each count is a SQLite query
         """
+        cached = self._counts.get(collection_name)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
         try:
             collection = self.get_collection(collection_name)
-            return collection._collection.count()
+            count = collection._collection.count()
         except Exception:
+            logger.exception("Error counting collection %s", collection_name)
             return 0
 
+        self._counts[collection_name] = (
+            count,
+            time.monotonic() + settings.COLLECTION_COUNT_TTL,
+        )
+        return count
+
 
 # Singleton instance
 multi_store = MultiCollectionStore()
@@ -5,41 +5,45 @@ This service combines retrieval from multiple document collections
 (Bible, commentaries, study notes, etc.) for richer contextual responses.
 """
 
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional, Tuple
 from langchain.schema import Document
+from app.core.config import settings
 from app.services.multi_collection_store import multi_store
-from app.services.llm import get_completion
+from app.services.llm import chat_completion, stream_chat_completion
+from app.services.rag import with_type_label
+from app.services.rerank import rerank
+from app.services.response_cache import get_response_cache
 
 
-async def query_multi_source(
+async def _retrieve(
     question: str,
-    collections: List[str] = ["bible"],
-    k_per_collection: int = 3,
-) -> Dict:
+    collections: List[str],
+    k_per_collection: int,
+) -> Tuple[Dict[str, List[Document]], str, Dict[str, List[Dict]]]:
     """
-    Query multiple document collections for enhanced responses.
+    Retrieve documents and build the LLM context.
 
     Args:
         question: User question
-        collections: List of collections to query (bible, commentary, etc.)
+        collections: List of collections to query
         k_per_collection: Number of results per collection
 
     Returns:
-        Dictionary with answer and sources grouped by collection
+        Tuple of (results by collection, context string, sources by collection)
     """
     # Retrieve from multiple collections
-    results_by_collection = multi_store.search_multi_collection(
+    scored_by_collection = await multi_store.search_multi_collection(
         query=question,
         collections=collections,
         k_per_collection=k_per_collection,
+        with_scores=True,
     )
 
-    if not results_by_collection:
-        return {
-            "answer": "No relevant documents found. Please ensure documents have been ingested.",
-            "sources": {},
-            "collections_searched": collections,
-        }
+    results_by_collection = rerank(
+        scored_by_collection,
+        min_similarity=settings.RERANK_MIN_SIMILARITY,
+        max_sources=settings.RERANK_MAX_SOURCES,
+    )
 
     # Build context from all collections
     context_parts = []
@@ -54,7 +58,7 @@ async def query_multi_source(
         context_parts.append(f"\n=== {collection_label} ===\n")
 
         for doc in docs:
-            context_parts.append(doc.page_content)
+            context_parts.append(with_type_label(doc))
 
             sources[collection_name].append({
                 "content": doc.page_content,
@@ -63,49 +67,123 @@ async def query_multi_source(
 
     context = "\n\n---\n\n".join(context_parts)
 
+    return results_by_collection, context, sources
+
+
+async def query_multi_source(
+    question: str,
+    collections: List[str] = ["bible"],
+    k_per_collection: int = 3,
+) -> Dict:
+    """
+    Query multiple document collections for enhanced responses.
+
+    Args:
+        question: User question
+        collections: List of collections to query (bible, commentary, etc.)
+        k_per_collection: Number of results per collection
+
+    Returns:
+        Dictionary with answer and sources grouped by collection
+    """
+    # Serve a cached answer to the same or a near-identical question; the
+    # embedding is cached too, so retrieval below doesn't recompute it
+    cache = get_response_cache()
+    namespace = f"multi:{','.join(collections)}:{k_per_collection}"
+    query_embedding = await multi_store.embeddings.aembed_query(question)
+    cached = cache.get(namespace, question, query_embedding)
+    if cached is not None:
+        return cached
+
+    results_by_collection, context, sources = await _retrieve(
+        question, collections, k_per_collection
+    )
+
+    if not results_by_collection:
+        return {
+            "answer": "No relevant documents found. Please ensure documents have been ingested.",
+            "sources": {},
+            "collections_searched": collections,
+            "total_sources": 0,
+        }
+
     # Get LLM response with multi-source context
     answer = await get_enhanced_completion(question, context, results_by_collection)
 
-    return {
+    result = {
         "answer": answer,
         "sources": sources,
         "collections_searched": list(results_by_collection.keys()),
         "total_sources": sum(len(docs) for docs in results_by_collection.values()),
     }
+    cache.put(namespace, question, query_embedding, result)
 
+    return result
 
-async def get_enhanced_completion(
+
+async def stream_multi_source(
     question: str,
-    context: str,
-    results_by_collection: Dict[str, List[Document]],
-) -> str:
+    collections: List[str] = ["bible"],
+    k_per_collection: int = 3,
+) -> AsyncIterator[Tuple[str, Dict]]:
     """
-    Get LLM completion with enhanced multi-source system prompt.
+    Query multiple document collections and stream the answer.
 
     Args:
         question: User question
-        context: Combined context from all sources
-        results_by_collection: Results organized by collection
+        collections: List of collections to query (bible, commentary, etc.)
+        k_per_collection: Number of results per collection
 
-    Returns:
-        LLM response
+    Yields:
+        ("sources", ...) once retrieval finishes, then ("token", ...) for
+        each generated text delta, then ("done", {})
     """
-    # Determine which types of sources we have
-    has_bible = "bible" in results_by_collection
-    has_commentary = "commentary" in results_by_collection
-    has_notes = "study_notes" in results_by_collection
-    has_theological = "theological" in results_by_collection
+    results_by_collection, context, sources = await _retrieve(
+        question, collections, k_per_collection
+    )
 
-    # Build dynamic system prompt based on available sources
+    if not results_by_collection:
+        yield "sources", {
+            "sources": {},
+            "collections_searched": collections,
+            "total_sources": 0,
+        }
+        yield "token", {
+            "content": "No relevant documents found. Please ensure documents have been ingested."
+        }
+        yield "done", {}
+        return
+
+    yield "sources", {
+        "sources": sources,
+        "collections_searched": list(results_by_collection.keys()),
+        "total_sources": sum(len(docs) for docs in results_by_collection.values()),
+    }
+
+    async for content in stream_chat_completion(
+        _build_enhanced_messages(question, context, results_by_collection),
+        max_tokens=1500,
+    ):
+        yield "token", {"content": content}
+
+    yield "done", {}
+
+
+# System prompts by source-type bitmask; only 16 combinations exist
+SYSTEM_PROMPTS: Dict[int, str] = {}
+
+
+def _build_system_prompt(key: int) -> str:
+    """Build the multi-source system prompt for a source-type bitmask."""
     prompt_parts = ["You are a knowledgeable Bible study assistant with access to:"]
 
-    if has_bible:
+    if key & 0b1000:
         prompt_parts.append("- Scripture passages from the Bible")
-    if has_commentary:
+    if key & 0b0100:
         prompt_parts.append("- Biblical commentaries and scholarly analysis")
-    if has_notes:
+    if key & 0b0010:
         prompt_parts.append("- Study notes and devotional materials")
-    if has_theological:
+    if key & 0b0001:
         prompt_parts.append("- Theological texts and doctrinal resources")
 
     prompt_parts.append("\nYour response should:")
@@ -116,7 +194,58 @@ async def get_enhanced_completion(
     prompt_parts.append("5. Indicate the source type when referencing non-Scripture materials")
     prompt_parts.append("\nIf the context doesn't contain relevant information, say so honestly.")
 
-    system_prompt = "\n".join(prompt_parts)
+    return "\n".join(prompt_parts)
+
+
+def get_system_prompt(
+    has_bible: bool,
+    has_commentary: bool,
+    has_notes: bool,
+    has_theological: bool,
+) -> str:
+    """
+    Get the multi-source system prompt for the available source types.
+
+    Args:
+        has_bible: Scripture passages are in the context
+        has_commentary: Commentaries are in the context
+        has_notes: Study notes are in the context
+        has_theological: Theological texts are in the context
+
+    Returns:
+        System prompt, built once per combination and cached
+    """
+    key = (has_bible << 3) | (has_commentary << 2) | (has_notes << 1) | has_theological
+
+    system_prompt = SYSTEM_PROMPTS.get(key)
+    if system_prompt is None:
+        system_prompt = SYSTEM_PROMPTS[key] = _build_system_prompt(key)
+
+    return system_prompt
+
+
+def _build_enhanced_messages(
+    question: str,
+    context: str,
+    results_by_collection: Dict[str, List[Document]],
+) -> List[Dict[str, str]]:
+    """
+    Build chat messages with a multi-source system prompt.
+
+    Args:
+        question: User question
+        context: Combined context from all sources
+        results_by_collection: Results organized by collection
+
+    Returns:
+        Chat messages
+    """
+    system_prompt = get_system_prompt(
+        has_bible="bible" in results_by_collection,
+        has_commentary="commentary" in results_by_collection,
+        has_notes="study_notes" in results_by_collection,
+        has_theological="theological" in results_by_collection,
+    )
 
     # Build user message
     user_message = f"""{context}
@@ -125,35 +254,27 @@ Question: {question}
 
 Please provide a comprehensive answer that synthesizes insights from all available sources."""
 
-    # Use existing completion function with enhanced prompts
-    import httpx
-    from app.core.config import settings
-
-    OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
-
-    messages = [
+    return [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": user_message},
     ]
 
-    headers = {
-        "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": "http://localhost:3000",
-        "X-Title": "Hermeneutic Bible App",
-    }
 
-    payload = {
-        "model": settings.LLM_MODEL,
-        "messages": messages,
-        "max_tokens": 1500,
-        "temperature": 0.7,
-    }
+async def get_enhanced_completion(
+    question: str,
+    context: str,
+    results_by_collection: Dict[str, List[Document]],
+) -> str:
+    """
+    Get LLM completion with enhanced multi-source system prompt.
+
+    Args:
+        question: User question
+        context: Combined context from all sources
+        results_by_collection: Results organized by collection
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            OPENROUTER_URL, json=payload, headers=headers, timeout=60.0
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data["choices"][0]["message"]["content"]
+    Returns:
+        LLM response
+    """
+    messages = _build_enhanced_messages(question, context, results_by_collection)
+    return await chat_completion(messages, max_tokens=1500)
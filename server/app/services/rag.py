@@ -1,23 +1,41 @@
-from app.services.vector_store import similarity_search
-from app.services.llm import get_completion
+import asyncio
+from typing import AsyncIterator, Dict, List, Tuple
+from langchain.schema import Document
+from app.services.multi_collection_store import multi_store
+from app.services.embeddings import get_embeddings
+from app.services.llm import get_completion, stream_completion
+from app.services.response_cache import get_response_cache
 
+NO_PASSAGES_ANSWER = "No relevant passages found. Please ensure the Bible has been ingested."
 
-async def query_bible(question: str, num_passages: int = 5) -> dict:
-    """Query the Bible using RAG."""
-    # Retrieve relevant passages
-    docs = similarity_search(question, k=num_passages)
 
-    if not docs:
-        return {
-            "answer": "No relevant passages found. Please ensure the Bible has been ingested.",
-            "sources": [],
-        }
+def with_type_label(doc: Document) -> str:
+    """Prefix a document's text with its ingestion-time type label, if any."""
+    label = doc.metadata.get("doc_type_prefix")
+    return f"{label} {doc.page_content}" if label else doc.page_content
+
+
+async def _retrieve(
+    question: str,
+    query_embedding: List[float],
+    num_passages: int,
+) -> Tuple[str, List[Dict]]:
+    """Retrieve passages and build the LLM context and sources."""
+    # Searches go through the collection store so SEARCH_BACKEND applies;
+    # they block, so run them off the event loop
+    docs = await asyncio.to_thread(
+        multi_store.search_collection,
+        "bible",
+        question,
+        k=num_passages,
+        query_embedding=query_embedding,
+    )
 
     # Build context from retrieved documents
     context_parts = []
     sources = []
     for doc in docs:
-        context_parts.append(doc.page_content)
+        context_parts.append(with_type_label(doc))
         sources.append(
             {
                 "content": doc.page_content,
@@ -27,10 +45,60 @@ async def query_bible(question: str, num_passages: int = 5) -> dict:
 
     context = "\n\n---\n\n".join(context_parts)
 
+    return context, sources
+
+
+async def query_bible(question: str, num_passages: int = 5) -> dict:
+    """Query the Bible using RAG."""
+    # Serve a cached answer to the same or a near-identical question; the
+    # embedding is cached too, so retrieval below doesn't recompute it
+    cache = get_response_cache()
+    namespace = f"bible:{num_passages}"
+    query_embedding = await get_embeddings().aembed_query(question)
+    cached = cache.get(namespace, question, query_embedding)
+    if cached is not None:
+        return cached
+
+    # Retrieve relevant passages
+    context, sources = await _retrieve(question, query_embedding, num_passages)
+
+    if not sources:
+        return {
+            "answer": NO_PASSAGES_ANSWER,
+            "sources": [],
+        }
+
     # Get LLM response
     answer = await get_completion(question, context)
 
-    return {
+    result = {
         "answer": answer,
         "sources": sources,
     }
+    cache.put(namespace, question, query_embedding, result)
+
+    return result
+
+
+async def stream_bible(
+    question: str,
+    num_passages: int = 5,
+) -> AsyncIterator[Tuple[str, Dict]]:
+    """
+    Query the Bible using RAG and stream the answer.
+
+    Yields ("sources", ...) once retrieval finishes, then ("token", ...)
+    for each generated text delta, then ("done", {}).
+    """
+    query_embedding = await get_embeddings().aembed_query(question)
+    context, sources = await _retrieve(question, query_embedding, num_passages)
+
+    yield "sources", {"sources": sources}
+
+    if not sources:
+        yield "token", {"content": NO_PASSAGES_ANSWER}
+    else:
+        async for content in stream_completion(question, context):
+            yield "token", {"content": content}
+
+    yield "done", {}
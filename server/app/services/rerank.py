@@ -0,0 +1,54 @@
+"""
+Similarity Rerank for Multi-Source Retrieval.
+
+Pools the scored hits of every queried collection and ranks them by cosine
+similarity to the question, so the best sources lead the LLM context
+regardless of which collection they came from.
+"""
+
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from langchain.schema import Document
+
+
+def rerank(
+    scored_by_collection: Dict[str, List[Tuple[Document, float]]],
+    min_similarity: Optional[float] = None,
+    max_sources: int = 0,
+) -> Dict[str, List[Document]]:
+    """
+    Rank the pooled results of every collection by similarity to the question.
+
+    Args:
+        scored_by_collection: (document, cosine similarity) pairs per collection
+        min_similarity: Drop documents scoring below this (None keeps all);
+            MiniLM often gives retrieved hits negative scores
+        max_sources: Keep at most this many documents overall (0 keeps all)
+
+    Returns:
+        Documents grouped by collection, best collection and document first
+    """
+    pool = [
+        (collection_name, doc, score)
+        for collection_name, scored in scored_by_collection.items()
+        for doc, score in scored
+    ]
+    if not pool:
+        return {}
+
+    scores = np.fromiter((score for _, _, score in pool), dtype=np.float32, count=len(pool))
+
+    if min_similarity is None:
+        keep = np.arange(len(pool))
+    else:
+        keep = np.flatnonzero(scores >= min_similarity)
+    if max_sources and len(keep) > max_sources:
+        keep = keep[np.argpartition(-scores[keep], max_sources - 1)[:max_sources]]
+    keep = keep[np.argsort(-scores[keep], kind="stable")]
+
+    reranked = {}
+    for i in keep:
+        collection_name, doc, _ = pool[i]
+        reranked.setdefault(collection_name, []).append(doc)
+
+    return reranked
@@ -0,0 +1,175 @@
+"""
+Semantic Response Cache.
+
+Caches LLM answers by question embedding so a question close enough to one
+already answered is served without retrieval or an LLM call. Embeddings of
+recent questions live in an hnswlib graph used as a ring buffer: once full,
+each new entry overwrites the oldest slot. Exact repeats are matched by the
+SHA-256 digest of the question first, and exact_only disables the
+similarity lookup for deployments that can't tolerate near-miss answers.
+Entries expire after ttl seconds, so answers built on an older retrieval
+stop being served once newly ingested documents could change them.
+"""
+
+import time
+import hashlib
+import threading
+import hnswlib
+import numpy as np
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from app.core.config import settings
+
+
+class SemanticResponseCache:
+    """Bounded cache of responses keyed by question similarity."""
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        min_similarity: float = 0.97,
+        exact_only: bool = False,
+        neighbors: int = 4,
+        ttl: float = 0,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Number of responses kept (0 disables the cache)
+            min_similarity: Cosine similarity a question needs to reuse an answer
+            exact_only: Only reuse answers to identical questions
+            neighbors: Nearest cached questions checked per lookup
+            ttl: Seconds a response is served for (0 keeps it until evicted)
+        """
+        self.maxsize = maxsize
+        self.min_similarity = min_similarity
+        self.exact_only = exact_only
+        self.neighbors = neighbors
+        self.ttl = ttl
+
+        self._index: Optional[hnswlib.Index] = None
+        # Slot -> (namespace, question digest, expiry, response)
+        self._entries: List[Optional[Tuple[str, bytes, float, dict]]] = [None] * maxsize
+        self._exact: Dict[Tuple[str, bytes], int] = {}
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        namespace: str,
+        question: str,
+        query_embedding: List[float],
+    ) -> Optional[dict]:
+        """
+        Look up a cached response.
+
+        Args:
+            namespace: Scope of the response (endpoint and its parameters)
+            question: User question
+            query_embedding: Normalized embedding of the question
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        if not self.maxsize:
+            return None
+
+        digest = hashlib.sha256(question.encode()).digest()
+        now = time.monotonic()
+
+        with self._lock:
+            slot = self._exact.get((namespace, digest))
+            if slot is not None:
+                entry = self._entries[slot]
+                return entry[3] if self._is_fresh(entry, now) else None
+
+            if self.exact_only or self._index is None:
+                return None
+
+            count = self._index.get_current_count()
+            if not count:
+                return None
+
+            labels, distances = self._index.knn_query(
+                np.asarray(query_embedding, dtype=np.float32),
+                k=min(self.neighbors, count),
+            )
+
+            # Inner-product space reports 1 - dot(q, x)
+            for slot, distance in zip(labels[0], distances[0]):
+                if 1.0 - distance < self.min_similarity:
+                    break
+                entry = self._entries[slot]
+                if (
+                    entry is not None
+                    and entry[0] == namespace
+                    and self._is_fresh(entry, now)
+                ):
+                    return entry[3]
+
+        return None
+
+    def _is_fresh(self, entry: Tuple[str, bytes, float, dict], now: float) -> bool:
+        """Whether a cached entry is still within its TTL."""
+        return not self.ttl or entry[2] > now
+
+    def put(
+        self,
+        namespace: str,
+        question: str,
+        query_embedding: List[float],
+        response: dict,
+    ) -> None:
+        """
+        Cache a response, overwriting the oldest entry when full.
+
+        Args:
+            namespace: Scope of the response (endpoint and its parameters)
+            question: User question
+            query_embedding: Normalized embedding of the question
+            response: Response to serve for matching questions
+        """
+        if not self.maxsize:
+            return
+
+        digest = hashlib.sha256(question.encode()).digest()
+        vector = np.asarray(query_embedding, dtype=np.float32)
+        now = time.monotonic()
+        entry = (namespace, digest, now + self.ttl, response)
+
+        with self._lock:
+            # Refresh an expired exact entry in its own slot
+            slot = self._exact.get((namespace, digest))
+            if slot is not None:
+                if not self._is_fresh(self._entries[slot], now):
+                    self._entries[slot] = entry
+                return
+
+            if self._index is None:
+                self._index = hnswlib.Index(space="ip", dim=len(vector))
+                self._index.init_index(max_elements=self.maxsize, M=16, ef_construction=100)
+                self._index.set_ef(32)
+
+            slot = self._next
+            self._next = (slot + 1) % self.maxsize
+
+            evicted = self._entries[slot]
+            if evicted is not None:
+                self._exact.pop((evicted[0], evicted[1]), None)
+
+            # Re-adding an existing label replaces that slot's vector
+            self._index.add_items(vector[np.newaxis], np.array([slot]))
+            self._entries[slot] = entry
+            self._exact[(namespace, digest)] = slot
+
+
+@lru_cache()
+def get_response_cache() -> SemanticResponseCache:
+    """Get the process-wide response cache."""
+    return SemanticResponseCache(
+        maxsize=settings.RESPONSE_CACHE_SIZE,
+        min_similarity=settings.RESPONSE_CACHE_MIN_SIMILARITY,
+        exact_only=settings.RESPONSE_CACHE_EXACT_ONLY,
+        ttl=settings.RESPONSE_CACHE_TTL,
+    )
@@ -1,3 +1,4 @@
+from functools import lru_cache
 import chromadb
 from chromadb.config import Settings as ChromaSettings
 from langchain_community.vectorstores import Chroma
@@ -5,8 +6,9 @@ from app.core.config import settings
 from app.services.embeddings import get_embeddings
 
 
+@lru_cache()
 def get_vector_store() -> Chroma:
-    """Get or create ChromaDB vector store."""
+    """Get or create the ChromaDB vector store (created once per process)."""
     embeddings = get_embeddings()
 
     client = chromadb.PersistentClient(
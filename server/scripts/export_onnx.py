@@ -0,0 +1,64 @@
+"""
+Export an INT8-quantized ONNX copy of the embedding model.
+
+The default all-MiniLM-L6-v2 repository already ships
+onnx/model_qint8_avx512_vnni.onnx, so this is only needed when
+EMBEDDING_MODEL points at a model without a quantized export.
+
+Usage:
+    # Export to the model's local directory
+    python scripts/export_onnx.py --output models/minilm
+
+    # Target AVX2-only CPUs
+    python scripts/export_onnx.py --output models/minilm --config avx2
+
+Then set EMBEDDING_MODEL=models/minilm and
+EMBEDDING_ONNX_FILE=onnx/model_qint8_<config>.onnx.
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+from app.core.config import settings
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export a dynamically quantized ONNX embedding model"
+    )
+    parser.add_argument(
+        "--model",
+        default=settings.EMBEDDING_MODEL,
+        help="Model name or path (default: EMBEDDING_MODEL)",
+    )
+    parser.add_argument(
+        "--output",
+        required=True,
+        help="Directory to save the model and quantized export to",
+    )
+    parser.add_argument(
+        "--config",
+        choices=["arm64", "avx2", "avx512", "avx512_vnni"],
+        default="avx512_vnni",
+        help="Quantization target (default: avx512_vnni)",
+    )
+
+    args = parser.parse_args()
+
+    print(f"Loading {args.model} with ONNX backend...")
+    model = SentenceTransformer(args.model, device="cpu", backend="onnx")
+    model.save_pretrained(args.output)
+
+    print(f"Quantizing for {args.config}...")
+    export_dynamic_quantized_onnx_model(model, args.config, args.output)
+
+    print(f"Saved to {args.output}/onnx/model_qint8_{args.config}.onnx")
+
+
+if __name__ == "__main__":
+    main()
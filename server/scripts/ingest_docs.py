@@ -28,31 +28,115 @@ Usage:
     python scripts/ingest_additional_documents.py --collection study_notes --input data/notes/ --format txt
 """
 
+import os
 import sys
 import json
 import re
+import orjson
+import hashlib
 import argparse
+import queue
+import itertools
+import threading
+import contextlib
+import multiprocessing
 from pathlib import Path
-from typing import List, Dict, Optional, Set
-from collections import Counter
+from typing import Iterable, Iterator, List, Dict, Optional, Set, Tuple
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from tqdm import tqdm
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from langchain.schema import Document
+from langchain_core.documents import Document
 from langchain_community.document_loaders import (
+    PyMuPDFLoader,
+    PyPDFium2Loader,
     PyPDFLoader,
     TextLoader,
-    DirectoryLoader,
 )
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from app.services.multi_collection_store import multi_store
+from app.core.config import settings
+
+# PDF loaders by PDF_LOADER setting; MuPDF and PDFium parse in native code
+# and are much faster than pypdf on large PDFs
+PDF_LOADERS = {
+    "pymupdf": PyMuPDFLoader,
+    "pypdfium2": PyPDFium2Loader,
+    "pypdf": PyPDFLoader,
+}
+
+# File extensions lazy_load_file can read
+TEXT_SUFFIXES = (".txt", ".md")
+LOADABLE_SUFFIXES = (".pdf", *TEXT_SUFFIXES)
+
+# Worker pools start fresh interpreters rather than forking, so they never
+# inherit the embedding model, its thread pool or the Chroma client
+MP_CONTEXT = multiprocessing.get_context("spawn")
 
 
 # ============================================================================
 # PREPROCESSING FUNCTIONS FOR PROMPT ENGINEERING & RAG OPTIMIZATION
 # ============================================================================
 
+# Single-pass character fixes for clean_text: drop control characters
+# (keeping tab, newline and carriage return) and normalize PDF artifacts
+PDF_CHAR_MAP = str.maketrans({
+    **{chr(c): None for c in [*range(0x00, 0x09), 0x0b, 0x0c, *range(0x0e, 0x20)]},
+    '\uf0b7': '•',  # Bullet points
+    '\u2022': '•',
+    '\u2013': '-',  # En dash
+    '\u2014': '—',  # Em dash
+    '\u201c': '"',  # Smart quotes
+    '\u201d': '"',
+    '\u2018': "'",
+    '\u2019': "'",
+})
+
+# Patterns used per document and per line, compiled once at import
+BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n+')
+INNER_SPACES_RE = re.compile(r'(?<=\S)  +')
+THEOLOGICAL_TERMS_RE = re.compile(
+    r'\b(?:Scripture|Biblical|Gospel|Covenant|Testament|Theological?|Hermeneutic|'
+    r'Exegesis|Doctrine|Principle|Author|Context|Interpretation)\b',
+    re.IGNORECASE
+)
+PRINCIPLE_LINE_RE = re.compile(r'^\d+\..*(?:principle|rule|goal|responsibility)', re.IGNORECASE)
+EXAMPLE_LINE_RE = re.compile(r'^(?:example|e\.g\.|for instance)', re.IGNORECASE)
+INSTRUCTION_MARKERS = ('task:', 'step', 'how to', 'seek to')
+
+# Trigger words by tag, matched as substrings of the lowercased filename or text
+DOCUMENT_TYPE_KEYWORDS = (
+    ('principles', ('principle', 'hermeneutic')),
+    ('study_guide', ('tips', 'guide', 'study')),
+    ('methodology', ('method', 'inductive')),
+    ('theological_framework', ('theology', 'covenant', 'dispensation')),
+)
+SUBJECT_KEYWORDS = (
+    ('hermeneutics', ('hermeneutic', 'interpret', 'exegesis')),
+    ('bible_study_methods', ('inductive', 'observation', 'meditation')),
+    ('systematic_theology', ('covenant', 'dispensation', 'theology')),
+    ('biblical_books', ('proverb', 'psalm', 'revelation', 'gospel')),
+)
+CONTENT_TAG_KEYWORDS = (
+    # Content type
+    ('foundational_principle', ('principle', 'fundamental', 'rule', 'must', 'should')),
+    ('practical_instruction', ('task', 'step', 'how to', 'method', 'process')),
+    ('illustrative_example', ('example', 'for instance', 'such as', 'like')),
+    # Authority level
+    ('scripture_based', ('scripture', 'biblical')),
+    # Application context
+    ('interpretation_guidance', ('interpret', 'understand', 'read')),
+    ('contextual_analysis', ('context',)),
+)
+CHUNK_TAG_KEYWORDS = (
+    ('contains_principles', ('principle', 'rule', 'fundamental')),
+    ('contains_instructions', ('task:', 'step', 'how to')),
+    ('contains_questions', ('?',)),
+)
+
 
 def clean_text(text: str) -> str:
     """
@@ -63,29 +147,19 @@ def clean_text(text: str) -> str:
     - Fixes common PDF extraction artifacts
     - Preserves intentional formatting (lists, paragraphs)
     """
-    # Remove null bytes and other control characters
-    text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f]', '', text)
-
-    # Fix common PDF artifacts
-    text = text.replace('\uf0b7', '•')  # Bullet points
-    text = text.replace('\u2022', '•')
-    text = text.replace('\u2013', '-')  # En dash
-    text = text.replace('\u2014', '—')  # Em dash
-    text = text.replace('\u201c', '"')  # Smart quotes
-    text = text.replace('\u201d', '"')
-    text = text.replace('\u2018', "'")
-    text = text.replace('\u2019', "'")
+    # Remove control characters and fix common PDF artifacts in one pass
+    text = text.translate(PDF_CHAR_MAP)
 
     # Normalize whitespace while preserving structure
     # Keep single line breaks, collapse multiple
-    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+    text = BLANK_LINES_RE.sub('\n\n', text)
 
     # Remove trailing/leading whitespace per line
     lines = [line.rstrip() for line in text.split('\n')]
     text = '\n'.join(lines)
 
     # Collapse multiple spaces (but not at line start for indentation)
-    text = re.sub(r'(?<=\S)  +', ' ', text)
+    text = INNER_SPACES_RE.sub(' ', text)
 
     return text.strip()
 
@@ -107,44 +181,32 @@ def extract_document_metadata(text: str, file_path: str) -> Dict[str, any]:
     }
 
     # Classify document type based on filename and content
-    doc_types = []
-    if any(word in filename.lower() for word in ['principle', 'hermeneutic']):
-        doc_types.append('principles')
-    if any(word in filename.lower() for word in ['tips', 'guide', 'study']):
-        doc_types.append('study_guide')
-    if any(word in filename.lower() for word in ['method', 'inductive']):
-        doc_types.append('methodology')
-    if any(word in filename.lower() for word in ['theology', 'covenant', 'dispensation']):
-        doc_types.append('theological_framework')
+    filename_lower = filename.lower()
+    doc_types = [
+        doc_type
+        for doc_type, keywords in DOCUMENT_TYPE_KEYWORDS
+        if any(word in filename_lower for word in keywords)
+    ]
 
     metadata['document_type'] = doc_types if doc_types else ['general']
 
     # Extract subject matter
-    subjects = []
     content_lower = text.lower()
-
-    if any(word in content_lower for word in ['hermeneutic', 'interpret', 'exegesis']):
-        subjects.append('hermeneutics')
-    if any(word in content_lower for word in ['inductive', 'observation', 'meditation']):
-        subjects.append('bible_study_methods')
-    if any(word in content_lower for word in ['covenant', 'dispensation', 'theology']):
-        subjects.append('systematic_theology')
-    if any(word in content_lower for word in ['proverb', 'psalm', 'revelation', 'gospel']):
-        subjects.append('biblical_books')
+    subjects = [
+        subject
+        for subject, keywords in SUBJECT_KEYWORDS
+        if any(word in content_lower for word in keywords)
+    ]
 
     metadata['subjects'] = subjects if subjects else ['general']
 
     # Identify key topics (words that appear frequently and are meaningful)
     # Extract capitalized phrases and important theological terms
-    theological_terms = re.findall(
-        r'\b(?:Scripture|Biblical|Gospel|Covenant|Testament|Theological?|Hermeneutic|'
-        r'Exegesis|Doctrine|Principle|Author|Context|Interpretation)\b',
-        text,
-        re.IGNORECASE
-    )
+    # Searching the lowercased text yields lowercase terms directly
+    theological_terms = THEOLOGICAL_TERMS_RE.findall(content_lower)
 
     # Count frequency
-    term_counts = Counter([term.lower() for term in theological_terms])
+    term_counts = Counter(theological_terms)
     top_terms = [term for term, count in term_counts.most_common(5) if count > 1]
     metadata['key_topics'] = top_terms
 
@@ -177,31 +239,31 @@ def detect_content_structure(text: str) -> Dict[str, List[str]]:
         'definitions': []
     }
 
-    lines = text.split('\n')
-
-    for line in lines:
+    # Lowercase the whole text once rather than every line; lowercasing
+    # never adds or removes line breaks, so the two splits stay aligned
+    for line, line_lower in zip(text.split('\n'), text.lower().split('\n')):
         line_stripped = line.strip()
         if not line_stripped:
             continue
 
         # Detect principles (numbered statements, definitive rules)
-        if re.match(r'^\d+\..*(?:principle|rule|goal|responsibility)', line_stripped, re.IGNORECASE):
+        if line_stripped[0].isdigit() and PRINCIPLE_LINE_RE.match(line_stripped):
             structure['principles'].append(line_stripped)
 
         # Detect instructions (imperative verbs, task markers)
-        if any(marker in line_stripped.lower() for marker in ['task:', 'step', 'how to', 'seek to']):
+        if any(marker in line_lower for marker in INSTRUCTION_MARKERS):
             structure['instructions'].append(line_stripped)
 
         # Detect examples
-        if re.match(r'^(?:example|e\.g\.|for instance)', line_stripped, re.IGNORECASE):
+        if line_stripped[0] in 'eEfF' and EXAMPLE_LINE_RE.match(line_stripped):
             structure['examples'].append(line_stripped)
 
         # Detect questions
-        if '?' in line_stripped and len(line_stripped) < 200:
+        if len(line_stripped) < 200 and '?' in line_stripped:
             structure['questions'].append(line_stripped)
 
-        # Detect definitions
-        if ':' in line_stripped and len(line_stripped.split(':')[0]) < 50:
+        # Detect definitions (a colon within the first 50 characters)
+        if 0 <= line_stripped.find(':') < 50:
             structure['definitions'].append(line_stripped)
 
     return structure
@@ -219,40 +281,46 @@ def add_contextual_tags(document: Document) -> Document:
     text = document.page_content
     metadata = document.metadata
 
-    # Tag content based on patterns
-    tags = set()
+    # Tag content based on trigger words, lowercasing the text only once
+    text_lower = text.lower()
+    tags = {
+        tag
+        for tag, keywords in CONTENT_TAG_KEYWORDS
+        if any(word in text_lower for word in keywords)
+    }
 
-    # Content type tags
-    if re.search(r'(?:principle|fundamental|rule|must|should)', text, re.IGNORECASE):
-        tags.add('foundational_principle')
+    metadata['content_tags'] = list(tags)
 
-    if re.search(r'(?:task|step|how to|method|process)', text, re.IGNORECASE):
-        tags.add('practical_instruction')
+    # Keep the document type label in metadata rather than the text, so it
+    # doesn't skew embeddings; it is added back when building LLM context
+    doc_type = metadata.get('document_type', ['general'])[0]
+    metadata['doc_type_prefix'] = f"[{doc_type.upper()}]"
 
-    if re.search(r'(?:example|for instance|such as|like)', text, re.IGNORECASE):
-        tags.add('illustrative_example')
+    return Document(
+        page_content=text,
+        metadata=metadata
+    )
 
-    # Authority level
-    if 'scripture' in text.lower() or 'biblical' in text.lower():
-        tags.add('scripture_based')
 
-    # Application context
-    if any(word in text.lower() for word in ['interpret', 'understand', 'read']):
-        tags.add('interpretation_guidance')
+def _list_to_csv(value: list) -> str:
+    """Convert a list to a comma-separated string."""
+    return ', '.join(str(v) for v in value)
 
-    if 'context' in text.lower():
-        tags.add('contextual_analysis')
 
-    metadata['content_tags'] = list(tags)
+def _identity(value):
+    return value
 
-    # Add a summary prefix for better retrieval
-    doc_type = metadata.get('document_type', ['general'])[0]
-    summary_prefix = f"[{doc_type.upper()}] "
 
-    return Document(
-        page_content=summary_prefix + text,
-        metadata=metadata
-    )
+# Serializer for each exact metadata value type, so the common types cost
+# one dict lookup instead of a chain of isinstance checks
+_SERIALIZERS = {
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    list: _list_to_csv,
+    dict: json.dumps,
+}
 
 
 def serialize_metadata(metadata: Dict) -> Dict:
@@ -265,13 +333,14 @@ def serialize_metadata(metadata: Dict) -> Dict:
     serialized = {}
 
     for key, value in metadata.items():
-        if isinstance(value, (str, int, float, bool)):
+        serializer = _SERIALIZERS.get(type(value))
+        if serializer is not None:
+            serialized[key] = serializer(value)
+        elif isinstance(value, (str, int, float, bool)):
             serialized[key] = value
         elif isinstance(value, list):
-            # Convert list to comma-separated string
-            serialized[key] = ', '.join(str(v) for v in value)
+            serialized[key] = _list_to_csv(value)
         elif isinstance(value, dict):
-            # Convert dict to JSON string
             serialized[key] = json.dumps(value)
         else:
             # Convert anything else to string
@@ -287,7 +356,7 @@ def preprocess_document(document: Document, file_path: str = None) -> Document:
     Steps:
     1. Clean text (normalize formatting)
     2. Extract metadata (classify and tag)
-    3. Detect structure (identify semantic elements)
+    3. Detect structure (count semantic elements)
     4. Add contextual tags (enhance retrieval)
     5. Serialize metadata for ChromaDB
     """
@@ -301,9 +370,12 @@ def preprocess_document(document: Document, file_path: str = None) -> Document:
     # Merge with existing metadata
     enriched_metadata.update(document.metadata)
 
-    # Detect structure
+    # Detect structure; only the counts are stored, since the matched lines
+    # repeat the page content and would bloat every chunk's metadata
     structure = detect_content_structure(cleaned_text)
-    enriched_metadata['structure'] = structure
+    enriched_metadata['structure_counts'] = ';'.join(
+        f'{category}={len(lines)}' for category, lines in structure.items()
+    )
 
     # Create updated document
     processed_doc = Document(
@@ -320,34 +392,80 @@ def preprocess_document(document: Document, file_path: str = None) -> Document:
     return final_doc
 
 
-def preprocess_documents(documents: List[Document], file_paths: List[str] = None) -> List[Document]:
+def _preprocess_worker(args) -> Tuple[Document, Optional[str]]:
     """
-    Preprocess a batch of documents for optimal RAG performance.
-    """
-    print(f"\n{'='*80}")
-    print("PREPROCESSING DOCUMENTS FOR KNOWLEDGE BASE")
-    print(f"{'='*80}")
+    Preprocess one (index, document, file_path) item, keeping the original on failure.
 
-    processed = []
+    Module-level so it can be pickled for worker processes. Failures are
+    returned as a warning rather than printed, so the parent can write it
+    above its progress bar.
+    """
+    i, doc, file_path = args
 
-    for i, doc in enumerate(documents):
-        file_path = file_paths[i] if file_paths and i < len(file_paths) else None
+    try:
+        return preprocess_document(doc, file_path), None
+    except Exception as e:
+        # Keep original if preprocessing fails
+        return doc, f"  Warning: Failed to preprocess document {i}: {e}"
 
-        try:
-            processed_doc = preprocess_document(doc, file_path)
-            processed.append(processed_doc)
 
-            if (i + 1) % 10 == 0:
-                print(f"  Processed {i + 1}/{len(documents)} documents...")
+def iter_preprocessed(
+    documents: Iterable[Document],
+    file_paths: List[str] = None,
+    workers: int = 1,
+    chunksize: int = 32,
+) -> Iterator[Document]:
+    """
+    Preprocess documents lazily, in input order.
 
-        except Exception as e:
-            print(f"  Warning: Failed to preprocess document {i}: {e}")
-            processed.append(doc)  # Keep original if preprocessing fails
+    Args:
+        documents: Documents to preprocess; may be a lazy iterator
+        file_paths: Source path for each document, overriding its metadata
+        workers: Processes preprocessing in parallel
+        chunksize: Documents sent to a worker per task
 
-    print(f"  ✓ Successfully preprocessed {len(processed)} documents")
-    print(f"{'='*80}\n")
+    Yields:
+        Preprocessed documents
+    """
+    items = (
+        (i, doc, file_paths[i] if file_paths and i < len(file_paths) else None)
+        for i, doc in enumerate(documents)
+    )
 
-    return processed
+    if workers <= 1:
+        results = map(_preprocess_worker, items)
+    else:
+        results = _imap_bounded(_preprocess_worker, items, workers, chunksize)
+
+    for doc, warning in results:
+        if warning:
+            tqdm.write(warning)
+        yield doc
+
+
+def _imap_bounded(func, items: Iterable, workers: int, chunksize: int) -> Iterator:
+    """Map func over items in a worker pool, in order, with a bounded number in flight."""
+    # Pool.imap reads its whole input up front on a background thread, so
+    # gate the input on results being consumed; the workers stay busy while
+    # the memory use stays flat. The bound must be at least chunksize, or a
+    # task could wait on items that are waiting on its own results.
+    in_flight = threading.Semaphore(workers * chunksize * 2)
+    stop = threading.Event()
+
+    def gated():
+        for item in items:
+            while not in_flight.acquire(timeout=0.1):
+                if stop.is_set():
+                    return
+            yield item
+
+    with MP_CONTEXT.Pool(workers) as pool:
+        try:
+            for result in pool.imap(func, gated(), chunksize=chunksize):
+                in_flight.release()
+                yield result
+        finally:
+            stop.set()
 
 
 # ============================================================================
@@ -355,51 +473,162 @@ def preprocess_documents(documents: List[Document], file_paths: List[str] = None
 # ============================================================================
 
 
-def load_pdf(file_path: str) -> List[Document]:
-    """Load documents from PDF file."""
-    print(f"Loading PDF: {file_path}")
-    loader = PyPDFLoader(file_path)
-    documents = loader.load()
-    print(f"  Loaded {len(documents)} pages")
-    return documents
+def get_pdf_loader_cls(pdf_loader: Optional[str] = None):
+    """Get a PDF loader class by name, defaulting to the PDF_LOADER setting."""
+    return PDF_LOADERS[pdf_loader or settings.PDF_LOADER]
 
 
-def load_text(file_path: str) -> List[Document]:
-    """Load documents from text file."""
-    print(f"Loading text file: {file_path}")
-    loader = TextLoader(file_path)
-    documents = loader.load()
-    print(f"  Loaded {len(documents)} documents")
-    return documents
+def lazy_load_file(file_path: str, pdf_loader: Optional[str] = None) -> Iterator[Document]:
+    """Load one file page by page with the loader for its extension."""
+    suffix = Path(file_path).suffix.lower()
 
+    if suffix == ".pdf":
+        return get_pdf_loader_cls(pdf_loader)(file_path).lazy_load()
+    if suffix in TEXT_SUFFIXES:
+        return TextLoader(file_path).lazy_load()
 
-def load_directory(dir_path: str, file_pattern: str = "**/*.pdf") -> List[Document]:
-    """Load all documents from directory."""
-    print(f"Loading directory: {dir_path}")
-    print(f"  Pattern: {file_pattern}")
+    tqdm.write(f"  Skipping unsupported file: {file_path}")
+    return iter(())
 
-    # Determine loader based on pattern
-    if "*.pdf" in file_pattern:
-        loader = DirectoryLoader(
-            dir_path,
-            glob=file_pattern,
-            loader_cls=PyPDFLoader,
-            show_progress=True,
-        )
-    elif "*.txt" in file_pattern:
-        loader = DirectoryLoader(
-            dir_path,
-            glob=file_pattern,
-            loader_cls=TextLoader,
-            show_progress=True,
+
+def load_file(file_path: str, pdf_loader: Optional[str] = None) -> List[Document]:
+    """
+    Load one file with the loader for its extension.
+
+    Module-level so it can be pickled for worker processes.
+    """
+    return list(lazy_load_file(file_path, pdf_loader))
+
+
+# Pages buffered between the file parsers and the rest of the pipeline; when
+# it is full the parsers wait for chunking and inserting to catch up
+LOAD_QUEUE_SIZE = 200
+
+# Marks the end of the page queue
+_DONE = object()
+
+
+def _produce_pages(
+    file_paths: List[str],
+    pool,
+    pages: queue.Queue,
+    stop: threading.Event,
+    files_in_flight: int,
+    pdf_loader: Optional[str] = None,
+) -> None:
+    """
+    Parse files into the page queue, ending it with _DONE or the raised error.
+
+    Args:
+        file_paths: Files to parse, in order
+        pool: Process pool to parse in, or None to parse in this thread
+        pages: Bounded queue the pages are put on
+        stop: Set by the consumer when it stops reading
+        files_in_flight: Files handed to the pool ahead of the one being read
+        pdf_loader: PDF_LOADERS key, passed to workers explicitly since
+            they may not inherit this process's settings
+    """
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    try:
+        if pool is None:
+            for file_path in file_paths:
+                for doc in lazy_load_file(file_path, pdf_loader):
+                    if not put(doc):
+                        return
+        else:
+            # Keep only a few files per worker submitted at a time, since
+            # imap over every file would parse ahead without limit
+            remaining = iter(file_paths)
+            pending = deque(
+                pool.apply_async(load_file, (file_path, pdf_loader))
+                for file_path in itertools.islice(remaining, files_in_flight)
+            )
+            while pending:
+                docs = pending.popleft().get()
+                for file_path in itertools.islice(remaining, 1):
+                    pending.append(
+                        pool.apply_async(load_file, (file_path, pdf_loader))
+                    )
+                for doc in docs:
+                    if not put(doc):
+                        return
+        put(_DONE)
+    except Exception as e:
+        put(e)
+
+
+def iter_directory(
+    dir_path: str,
+    file_pattern: str = "**/*.pdf",
+    workers: int = 1,
+    pdf_loader: Optional[str] = None,
+) -> Iterator[Document]:
+    """
+    Load documents from a directory lazily through a bounded page queue.
+
+    Files are parsed in a background thread (and across processes when
+    workers > 1) while the caller chunks and inserts the pages already
+    read, and at most LOAD_QUEUE_SIZE pages wait in between.
+
+    Args:
+        dir_path: Directory to search
+        file_pattern: Glob pattern relative to dir_path
+        workers: Processes parsing files in parallel
+        pdf_loader: PDF_LOADERS key (default: PDF_LOADER setting)
+
+    Yields:
+        Documents from every matching file, in path order
+    """
+    # Printed through tqdm, since this can run while the ingest bar is showing
+    tqdm.write(f"Loading directory: {dir_path}")
+    tqdm.write(f"  Pattern: {file_pattern}")
+
+    file_paths = []
+    for path in sorted(Path(dir_path).glob(file_pattern)):
+        if not path.is_file():
+            continue
+        # Skip unsupported files here rather than in a worker, whose output
+        # would break up the progress bar
+        if path.suffix.lower() in LOADABLE_SUFFIXES:
+            file_paths.append(str(path))
+        else:
+            tqdm.write(f"  Skipping unsupported file: {path}")
+    tqdm.write(f"  Found {len(file_paths)} files ({workers} workers)")
+
+    pages = queue.Queue(maxsize=LOAD_QUEUE_SIZE)
+    stop = threading.Event()
+
+    with contextlib.ExitStack() as stack:
+        # PDF parsing is CPU-bound, so spread files across processes
+        pool = None
+        if workers > 1 and len(file_paths) > 1:
+            pool = stack.enter_context(
+                MP_CONTEXT.Pool(min(workers, len(file_paths)))
+            )
+
+        producer = threading.Thread(
+            target=_produce_pages,
+            args=(file_paths, pool, pages, stop, workers * 2, pdf_loader),
+            daemon=True,
         )
-    else:
-        print(f"Unsupported file pattern: {file_pattern}")
-        return []
+        producer.start()
 
-    documents = loader.load()
-    print(f"  Loaded {len(documents)} documents")
-    return documents
+        try:
+            while (item := pages.get()) is not _DONE:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            producer.join()
 
 
 def load_json(file_path: str) -> List[Document]:
@@ -417,8 +646,8 @@ def load_json(file_path: str) -> List[Document]:
     """
     print(f"Loading JSON: {file_path}")
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(file_path, 'rb') as f:
+        data = orjson.loads(f.read())
 
     documents = []
 
@@ -439,94 +668,228 @@ def load_json(file_path: str) -> List[Document]:
     return documents
 
 
-def chunk_documents(
-    documents: List[Document],
-    chunk_size: int = 1000,
-    chunk_overlap: int = 200,
-) -> List[Document]:
-    """
-    Split documents into semantic-aware chunks for better retrieval.
-
-    Uses intelligent separators to preserve document structure:
-    - Respects paragraph boundaries
-    - Keeps numbered lists together
-    - Preserves section headers with content
-
-    Args:
-        documents: List of documents to chunk
-        chunk_size: Maximum size of each chunk
-        chunk_overlap: Overlap between chunks
+# Semantic separators that preserve document structure, coarsest first
+CHUNK_SEPARATORS = (
+    "\n\n\n",  # Multiple line breaks (section boundaries)
+    "\n\n",    # Paragraph breaks
+    "\n",      # Line breaks
+    ". ",      # Sentences
+    " ",       # Words
+    "",        # Characters
+)
 
-    Returns:
-        List of chunked documents
-    """
-    print(f"\n{'='*80}")
-    print("CHUNKING DOCUMENTS")
-    print(f"{'='*80}")
-    print(f"  Chunk size: {chunk_size}")
-    print(f"  Chunk overlap: {chunk_overlap}")
 
-    # Use semantic separators to preserve structure
-    splitter = RecursiveCharacterTextSplitter(
+@lru_cache(maxsize=8)
+def get_splitter(
+    chunk_size: int,
+    chunk_overlap: int,
+    separators: tuple = CHUNK_SEPARATORS,
+) -> RecursiveCharacterTextSplitter:
+    """Get a text splitter, built once per configuration."""
+    return RecursiveCharacterTextSplitter(
         chunk_size=chunk_size,
         chunk_overlap=chunk_overlap,
         length_function=len,
         # Prioritize semantic boundaries
-        separators=[
-            "\n\n\n",  # Multiple line breaks (section boundaries)
-            "\n\n",    # Paragraph breaks
-            "\n",      # Line breaks
-            ". ",      # Sentences
-            " ",       # Words
-            "",        # Characters
-        ],
+        separators=list(separators),
         keep_separator=True,
     )
 
-    chunked = splitter.split_documents(documents)
 
-    # Post-process chunks to add chunk-specific metadata
-    for i, chunk in enumerate(chunked):
-        chunk.metadata['chunk_index'] = i
-        chunk.metadata['total_chunks'] = len(chunked)
+def iter_chunks(
+    documents: Iterable[Document],
+    chunk_size: int = 1000,
+    chunk_overlap: int = 50,
+) -> Iterator[Document]:
+    """
+    Split documents lazily into semantic-aware chunks for better retrieval.
 
-        # Identify if chunk contains key content types
-        content = chunk.page_content.lower()
-        chunk_tags = []
+    Chunks are numbered across the whole stream. They carry no
+    total_chunks, since the total isn't known until the stream is exhausted.
+    """
+    splitter = get_splitter(chunk_size, chunk_overlap)
+    chunk_index = 0
+
+    for doc in documents:
+        for chunk in splitter.split_documents([doc]):
+            chunk.metadata['chunk_index'] = chunk_index
+            chunk_index += 1
+            tag_chunk(chunk)
+            yield chunk
+
+
+def tag_chunk(chunk: Document) -> None:
+    """Tag a chunk with the key content types it contains."""
+    content = chunk.page_content.lower()
+    chunk_tags = [
+        tag
+        for tag, markers in CHUNK_TAG_KEYWORDS
+        if any(marker in content for marker in markers)
+    ]
 
-        if any(marker in content for marker in ['principle', 'rule', 'fundamental']):
-            chunk_tags.append('contains_principles')
-        if any(marker in content for marker in ['task:', 'step', 'how to']):
-            chunk_tags.append('contains_instructions')
-        if '?' in content:
-            chunk_tags.append('contains_questions')
+    if chunk_tags:
+        # Serialize list to comma-separated string
+        chunk.metadata['chunk_content_type'] = ', '.join(chunk_tags)
 
-        if chunk_tags:
-            # Serialize list to comma-separated string
-            chunk.metadata['chunk_content_type'] = ', '.join(chunk_tags)
 
-    print(f"  ✓ Created {len(chunked)} semantic chunks")
-    print(f"{'='*80}\n")
+def batched(iterable: Iterable, size: int) -> Iterator[list]:
+    """Split an iterable into lists of up to size items."""
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
 
-    return chunked
+
+def get_multi_store():
+    """
+    Import the collection store on first use.
+
+    Creating it opens Chroma and loads the embedding model, which --help,
+    argument errors and worker processes have no use for.
+    """
+    from app.services.multi_collection_store import multi_store
+
+    return multi_store
+
+
+# SQLite settings for --fast-bulk: no rollback journal or fsync, temp tables
+# in memory, and the database file locked for the duration of the load
+BULK_PRAGMAS = {
+    "journal_mode": "OFF",
+    "synchronous": "OFF",
+    "temp_store": "MEMORY",
+    "locking_mode": "EXCLUSIVE",
+}
+
+
+@contextlib.contextmanager
+def fast_bulk_sqlite(client) -> Iterator[None]:
+    """
+    Relax Chroma's SQLite durability for a bulk load, restoring it afterwards.
+
+    WARNING: a crash or power loss mid-load can corrupt the database, and
+    other processes can't open it until the load finishes. Only use this
+    for loads that can be rerun from scratch, with the API server stopped.
+
+    Args:
+        client: chromadb PersistentClient
+    """
+    try:
+        # Chroma keeps one SQLite connection per thread; ingestion writes
+        # from this one
+        conn = client._server._sysdb._conn_pool.connect()
+    except AttributeError:
+        print("  Warning: --fast-bulk needs a local SQLite-backed client; ignoring")
+        yield
+        return
+
+    previous = {
+        pragma: conn.execute(f"PRAGMA {pragma}").fetchone()[0]
+        for pragma in BULK_PRAGMAS
+    }
+    for pragma, value in BULK_PRAGMAS.items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
+
+    try:
+        yield
+    finally:
+        for pragma, value in previous.items():
+            conn.execute(f"PRAGMA {pragma} = {value}")
+        # The exclusive lock is only released by the next access
+        conn.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchall()
+
+
+def document_id(collection_name: str, document: Document) -> str:
+    """
+    Deterministic id for a document's content within a collection.
+
+    Re-ingesting the same text yields the same id, so reruns can skip it.
+    """
+    content = f"{collection_name}\0{document.page_content}".encode()
+    return hashlib.blake2b(content, digest_size=8).hexdigest()
 
 
 def ingest_to_collection(
     collection_name: str,
-    documents: List[Document],
-) -> None:
+    documents: Iterable[Document],
+    batch_size: int = 200,
+    concurrency: int = 2,
+) -> int:
     """
     Ingest documents into a ChromaDB collection.
 
+    Upcoming batches are embedded on worker threads while the current one
+    is inserted, so the embedding model and Chroma's writes overlap.
+    Inserts stay on the calling thread, in order. Documents whose content
+    is already in the collection, or repeats earlier in the stream, are
+    skipped before embedding.
+
     Args:
         collection_name: Name of the collection
-        documents: List of documents to ingest
+        documents: Documents to ingest; may be a lazy iterator
+        batch_size: Documents embedded and inserted per call
+        concurrency: Batches embedded ahead of the insert
+
+    Returns:
+        Number of documents processed, including skipped duplicates
     """
     print(f"\nIngesting into collection: {collection_name}")
 
+    multi_store = get_multi_store()
+    collection = multi_store.get_collection(collection_name)._collection
+    total = len(documents) if isinstance(documents, list) else None
+    processed = 0
+    ingested = 0
+    seen: Set[str] = set()
+
     try:
-        multi_store.add_documents(collection_name, documents)
-        print(f"  Successfully ingested {len(documents)} documents")
+        # Small batches keep each embed + insert call bounded in memory and
+        # amortize Chroma's per-call overhead
+        with tqdm(total=total, desc="  Ingesting", unit="doc") as progress, \
+                ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            pending = deque()
+
+            def insert_next():
+                batch, ids, embeddings = pending.popleft()
+                multi_store.add_documents(
+                    collection_name, batch, embeddings.result(), ids=ids
+                )
+                return len(batch)
+
+            for batch in batched(documents, batch_size):
+                # Embedding and inserting lag behind this, so the bar tracks
+                # documents pulled through load, preprocess and chunk
+                processed += len(batch)
+                progress.update(len(batch))
+
+                # Drop repeats within this run, then content already stored
+                new = {}
+                for doc in batch:
+                    doc_id = document_id(collection_name, doc)
+                    if doc_id not in seen:
+                        seen.add(doc_id)
+                        new[doc_id] = doc
+                if new:
+                    for doc_id in collection.get(ids=list(new), include=[])["ids"]:
+                        del new[doc_id]
+                if not new:
+                    continue
+
+                batch = list(new.values())
+                texts = [doc.page_content for doc in batch]
+                pending.append((
+                    batch,
+                    list(new),
+                    pool.submit(multi_store.embeddings.embed_documents, texts),
+                ))
+                if len(pending) > concurrency:
+                    ingested += insert_next()
+
+            while pending:
+                ingested += insert_next()
+
+        print(f"  Successfully ingested {ingested} documents")
+        if processed > ingested:
+            print(f"  Skipped {processed - ingested} duplicate or already-ingested documents")
 
         # Verify
         count = multi_store.get_collection_count(collection_name)
@@ -536,6 +899,8 @@ def ingest_to_collection(
         print(f"  Error ingesting documents: {e}")
         raise
 
+    return processed
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -563,6 +928,18 @@ def main():
         default="**/*.pdf",
         help="File pattern for directory mode (default: **/*.pdf)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=max(1, (os.cpu_count() or 2) - 1),
+        help="Processes loading and preprocessing files (default: CPU count - 1)",
+    )
+    parser.add_argument(
+        "--pdf-loader",
+        choices=sorted(PDF_LOADERS),
+        default=settings.PDF_LOADER,
+        help=f"PDF parser (default: PDF_LOADER setting, {settings.PDF_LOADER})",
+    )
     parser.add_argument(
         "--chunk-size",
         type=int,
@@ -572,8 +949,26 @@ def main():
     parser.add_argument(
         "--chunk-overlap",
         type=int,
+        default=50,
+        help="Chunk overlap (default: 50)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
         default=200,
-        help="Chunk overlap (default: 200)",
+        help="Documents per embed + insert batch (default: 200)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=2,
+        help="Batches embedded ahead of the Chroma insert (default: 2)",
+    )
+    parser.add_argument(
+        "--fast-bulk",
+        action="store_true",
+        help="Disable SQLite journaling and fsync during ingestion; rerun from "
+             "scratch if interrupted, and stop the API server first",
     )
     parser.add_argument(
         "--no-chunk",
@@ -601,6 +996,7 @@ def main():
     print(f"Collection: {args.collection}")
     print(f"Input: {args.input}")
     print(f"Format: {args.format}")
+    print(f"PDF loader: {args.pdf_loader}")
     print(f"Preprocessing: {'Enabled' if args.preprocess else 'Disabled'}")
     print(f"Chunking: {'Enabled' if not args.no_chunk else 'Disabled'}")
     print("="*80)
@@ -611,47 +1007,67 @@ def main():
         print(f"\nError: Input path does not exist: {args.input}")
         sys.exit(1)
 
-    # Load documents based on format
-    documents = []
+    # Documents stream through loading, preprocessing, chunking and
+    # ingestion, so only the current batch is held in memory
+    documents: Iterable[Document] = ()
 
     if args.format == "pdf":
         if input_path.is_file():
-            documents = load_pdf(str(input_path))
+            print(f"Loading PDF: {input_path}")
+            documents = lazy_load_file(str(input_path), args.pdf_loader)
         else:
-            documents = load_directory(str(input_path), "**/*.pdf")
+            documents = iter_directory(
+                str(input_path), "**/*.pdf", args.workers, args.pdf_loader
+            )
 
     elif args.format == "txt" or args.format == "md":
         if input_path.is_file():
-            documents = load_text(str(input_path))
+            print(f"Loading text file: {input_path}")
+            documents = lazy_load_file(str(input_path))
         else:
             pattern = f"**/*.{args.format}"
-            documents = load_directory(str(input_path), pattern)
+            documents = iter_directory(
+                str(input_path), pattern, args.workers, args.pdf_loader
+            )
 
     elif args.format == "json":
         documents = load_json(str(input_path))
 
     elif args.format == "directory":
-        documents = load_directory(str(input_path), args.pattern)
-
-    if not documents:
-        print("\nNo documents loaded. Exiting.")
-        sys.exit(1)
+        documents = iter_directory(
+            str(input_path), args.pattern, args.workers, args.pdf_loader
+        )
 
     # Preprocess documents for prompt engineering (unless disabled)
     if args.preprocess:
-        file_paths = [doc.metadata.get('source', '') for doc in documents]
-        documents = preprocess_documents(documents, file_paths)
+        documents = iter_preprocessed(documents, workers=args.workers)
 
     # Chunk documents (unless disabled)
     if not args.no_chunk:
-        documents = chunk_documents(
+        documents = iter_chunks(
             documents,
             chunk_size=args.chunk_size,
             chunk_overlap=args.chunk_overlap,
         )
 
+    # Pull the first document before loading the embedding model and opening
+    # Chroma, so empty input exits right away
+    documents = iter(documents)
+    first = next(documents, None)
+    if first is None:
+        print("\nNo documents loaded. Exiting.")
+        sys.exit(1)
+    documents = itertools.chain([first], documents)
+
     # Ingest into collection
-    ingest_to_collection(args.collection, documents)
+    bulk = fast_bulk_sqlite(get_multi_store().client) if args.fast_bulk else contextlib.nullcontext()
+    with bulk:
+        ingest_to_collection(
+            args.collection,
+            documents,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+        )
 
     print("\n" + "="*80)
     print("INGESTION COMPLETE")
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Add the server directory to the path so tests can import app
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,53 @@
+from langchain.schema import Document
+from app.services.rerank import rerank
+
+
+def _doc(text: str) -> Document:
+    return Document(page_content=text, metadata={})
+
+
+def test_keeps_negative_scores_without_a_floor():
+    scored = {
+        "bible": [(_doc("a"), -0.05), (_doc("b"), -0.2)],
+        "commentary": [(_doc("c"), -0.01)],
+    }
+
+    reranked = rerank(scored)
+
+    assert [doc.page_content for doc in reranked["commentary"]] == ["c"]
+    assert [doc.page_content for doc in reranked["bible"]] == ["a", "b"]
+
+
+def test_orders_collections_by_best_score():
+    scored = {
+        "bible": [(_doc("a"), 0.3)],
+        "commentary": [(_doc("c"), 0.8)],
+    }
+
+    assert list(rerank(scored)) == ["commentary", "bible"]
+
+
+def test_floor_drops_low_scores():
+    scored = {"bible": [(_doc("a"), 0.5), (_doc("b"), -0.1)]}
+
+    reranked = rerank(scored, min_similarity=0.0)
+
+    assert [doc.page_content for doc in reranked["bible"]] == ["a"]
+
+
+def test_max_sources_keeps_the_best():
+    scored = {
+        "bible": [(_doc("a"), 0.1), (_doc("b"), 0.9)],
+        "commentary": [(_doc("c"), 0.5)],
+    }
+
+    reranked = rerank(scored, max_sources=2)
+
+    assert {name: [d.page_content for d in docs] for name, docs in reranked.items()} == {
+        "bible": ["b"],
+        "commentary": ["c"],
+    }
+
+
+def test_empty_results():
+    assert rerank({}) == {}